@@ -1,22 +1,390 @@
+import heapq
+import threading
+import time
+from typing import Callable, Hashable, Iterable, Iterator, Optional
 from src.model.applicant_profile import ApplicantProfile
 from src.model.application_detail import ApplicationDetail
+from src.model.application_pdf import ApplicationPDF
 from src.model.search_result import SearchResult
+from src.utils.pattern_matching import PatternMatching
+from src.utils.batch_matching import BatchMatcher
+from src.utils.inverted_index import InvertedIndex
+from src.utils.suffix_array import SuffixArray
+from src.utils.process_search import ProcessSearchPool
+from src.utils.scanner import Scanner
+from src.utils.query_cache import QueryCache
+from src.utils.search_scheduler import CancellationToken
 
 class Model:
-    def __init__(self, 
-                applicant_profiles: list[ApplicantProfile], 
-                application_details: list[ApplicationDetail]) -> None:
-        self.applicant_profiles = applicant_profiles
-        self.application_details = application_details
-    
-    def match_exact(self, algorithm: str) -> list[SearchResult]:
-        match algorithm:
-            case "kmp":
-                pass
-            case "bm":
-                pass
-            case "ac":
-                pass
-    
-    def match_fuzzy(self) -> list[SearchResult]:
-        pass
\ No newline at end of file
+    # One counting mode for every algorithm, so switching algorithms never
+    # changes the scores.
+    OVERLAPPING_MATCHES = False
+    # Where the app keeps the suffix array between runs; a Model only reads
+    # and writes it when given it as `suffix_array_path`.
+    SUFFIX_ARRAY_PATH = "data/suffix_array.npz"
+    FUZZY_LIMIT = 2
+    ALL_KEYWORDS_BONUS = 10000000
+    # Documents scanned between two provisional rankings while streaming.
+    STREAM_BATCH = 256
+    # Minimum seconds between two provisional rankings handed to on_progress.
+    PROGRESS_INTERVAL = 0.1
+    # Token distances remembered per keyword by search_stream; the memo is
+    # reset when full so memory stays bounded on any corpus.
+    FUZZY_MEMO_SIZE = 200000
+
+    SINGLE_PATTERN = Scanner.SINGLE_PATTERN
+    MULTI_PATTERN = Scanner.MULTI_PATTERN
+    CORPUS = ("NumPy Batch", "Suffix Array")
+    ALIASES = {
+        "kmp": "KMP",
+        "bm": "Boyer-Moore",
+        "horspool": "Horspool",
+        "sunday": "Sunday",
+        "ac": "Aho-Corasick",
+        "wm": "Wu-Manber",
+        "batch": "NumPy Batch",
+        "sa": "Suffix Array",
+    }
+
+    def __init__(self, entries: list[tuple[ApplicantProfile, ApplicationDetail, ApplicationPDF]], cache: Optional[QueryCache] = None, corpus_version: Optional[Callable[[], Hashable]] = None, suffix_array_path: Optional[str] = None) -> None:
+        self.entries = entries
+        # The cache may outlive this model (the caller keeps one across
+        # prefetches), so every entry is tagged with `corpus_version()` and a
+        # reload or a database write makes the old rankings miss.
+        self.cache = cache
+        self.corpus_version = corpus_version or (lambda: 0)
+        self.suffix_array_path = suffix_array_path
+        self.applicant_profiles = [applicant for applicant, _, _ in entries]
+        self.application_details = [detail for _, detail, _ in entries]
+        self.entries_by_id = {entry[2].detail_id: entry for entry in entries}
+        self.positions = {entry[2].detail_id: position for position, entry in enumerate(entries)}
+
+        self.inverted_index = InvertedIndex.build(
+            (application_pdf.detail_id, application_pdf.cv_text) for _, _, application_pdf in entries
+        )
+        # Built on first use; with a `suffix_array_path` the suffix array is
+        # reused from disk while the corpus is unchanged.
+        self.batch_matcher: Optional[BatchMatcher] = None
+        self.suffix_array: Optional[SuffixArray] = None
+        self.process_pool: Optional[ProcessSearchPool] = None
+        # Superseded searches keep running next to new ones, so the lazy
+        # structures are built under one lock and never twice.
+        self.build_lock = threading.Lock()
+        # Per-keyword columns {detail_id: count} kept between incremental
+        # searches. Every algorithm counts the same way, so a column stays
+        # valid when only the algorithm changes.
+        self.columns: dict[str, dict[int, int]] = {}
+        self.columns_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        with self.build_lock:
+            if self.process_pool is not None:
+                self.process_pool.close()
+                self.process_pool = None
+
+    @staticmethod
+    def parse_keywords(query: str) -> list[str]:
+        return list(dict.fromkeys([kw.strip() for kw in query.lower().split(',') if kw.strip()]))
+
+    def _documents(self) -> list[tuple[int, str]]:
+        return [(application_pdf.detail_id, application_pdf.cv_text) for _, _, application_pdf in self.entries]
+
+    def count_matches(self, keywords: list[str], algorithm: str, use_process_pool: bool = False, limit: Optional[int] = None, progress: Optional[Callable[[dict[int, dict[str, int]], int, int], None]] = None, token: Optional[CancellationToken] = None) -> dict[int, dict[str, int]]:
+        algorithm = self.ALIASES.get(algorithm, algorithm)
+        overlapping = self.OVERLAPPING_MATCHES
+        counts: dict[int, dict[str, int]] = {}
+
+        if token is not None:
+            token.raise_if_cancelled()
+
+        if algorithm in self.CORPUS:
+            with self.build_lock:
+                if algorithm == "Suffix Array":
+                    if self.suffix_array is None:
+                        self.suffix_array = SuffixArray.load_or_build(
+                            [text for _, text in self._documents()], self.suffix_array_path
+                        )
+                    corpus_matcher = self.suffix_array
+                else:
+                    if self.batch_matcher is None:
+                        self.batch_matcher = BatchMatcher([text for _, text in self._documents()])
+                    corpus_matcher = self.batch_matcher
+            if token is not None:
+                token.raise_if_cancelled()
+            counts = self._count_corpus(corpus_matcher, self._documents(), keywords)
+            if progress is not None:
+                progress(counts, 1, 1)
+        elif use_process_pool and algorithm in ProcessSearchPool.SCAN_ALGORITHMS:
+            with self.build_lock:
+                if self.process_pool is None:
+                    self.process_pool = ProcessSearchPool(self._documents())
+            counts = self.process_pool.search(algorithm, keywords, overlapping, progress, token)
+        elif algorithm in self.SINGLE_PATTERN:
+            compile_matcher = self.SINGLE_PATTERN[algorithm]
+            counts = self.inverted_index.count_all([compile_matcher(keyword, overlapping) for keyword in keywords], progress, token)
+        elif algorithm in self.MULTI_PATTERN:
+            counts = self._scan(Scanner.compile(algorithm, keywords, overlapping), keywords, limit, progress, token)
+        else:
+            raise ValueError(f"Unsupported search algorithm '{algorithm}'.")
+        return counts
+
+    def count_incremental(self, keywords: list[str], algorithm: str, use_process_pool: bool = False, token: Optional[CancellationToken] = None) -> dict[int, dict[str, int]]:
+        # Only keywords without a column are scanned, and their columns must be
+        # complete, so no limit is passed down.
+        with self.columns_lock:
+            for keyword in list(self.columns):
+                if keyword not in keywords:
+                    del self.columns[keyword]
+
+            added = [keyword for keyword in keywords if keyword not in self.columns]
+            if added:
+                # Columns are only added once the scan finished, so a
+                # cancelled scan leaves none half-filled.
+                found = self.count_matches(added, algorithm, use_process_pool, token=token)
+                for keyword in added:
+                    self.columns[keyword] = {}
+                for detail_id, matches in found.items():
+                    for keyword, count in matches.items():
+                        self.columns[keyword][detail_id] = count
+
+            counts: dict[int, dict[str, int]] = {}
+            for keyword in keywords:
+                for detail_id, count in self.columns[keyword].items():
+                    counts.setdefault(detail_id, {})[keyword] = count
+            return counts
+
+    def _scan(self, scan: Callable[[str], dict[str, int]], keywords: list[str], limit: Optional[int], progress: Optional[Callable[[dict[int, dict[str, int]], int, int], None]] = None, token: Optional[CancellationToken] = None) -> dict[int, dict[str, int]]:
+        counts: dict[int, dict[str, int]] = {}
+        documents = self._documents()
+
+        # Only a CV holding every keyword can reach ALL_KEYWORDS_BONUS, so once
+        # `limit` of them are found nothing outside the index candidates for
+        # all keywords can make the top k. Scan those candidates first and
+        # skip the other CVs if they were enough.
+        phases = [documents]
+        if limit and keywords:
+            required = None
+            for keyword in keywords:
+                found = self.inverted_index.candidates(keyword)
+                required = found if required is None else required & found
+            phases = [
+                [document for document in documents if document[0] in required],
+                [document for document in documents if document[0] not in required],
+            ]
+
+        complete = 0
+        scanned = 0
+        for phase, phase_documents in enumerate(phases):
+            if phase > 0 and complete >= limit:
+                break
+            for start in range(0, len(phase_documents), self.STREAM_BATCH):
+                if token is not None:
+                    token.raise_if_cancelled()
+                batch = phase_documents[start:start + self.STREAM_BATCH]
+                found = Scanner.count(scan, batch)
+                counts.update(found)
+                complete += sum(1 for matches in found.values() if len(matches) == len(keywords))
+                scanned += len(batch)
+                if progress is not None and scanned < len(documents):
+                    progress(counts, scanned, len(documents))
+        if progress is not None:
+            progress(counts, len(documents), len(documents))
+        return counts
+
+    @classmethod
+    def _count_corpus(cls, corpus_matcher: BatchMatcher, documents: list[tuple[int, str]], keywords: list[str]) -> dict[int, dict[str, int]]:
+        return {
+            detail_id: matches
+            for (detail_id, _), matches in zip(documents, corpus_matcher.count_dicts(keywords, cls.OVERLAPPING_MATCHES))
+            if matches
+        }
+
+    @staticmethod
+    def _top(ranked: Iterable[tuple[tuple, int, dict[str, int]]], limit: Optional[int]) -> list[tuple[int, int, dict[str, int]]]:
+        # Items carry a (primary, -position) key where larger is better; the
+        # bounded min-heap keeps the best `limit` in O(k) memory.
+        if limit is None:
+            best = sorted(ranked, key=lambda item: item[0], reverse=True)
+        elif limit <= 0:
+            best = []
+        else:
+            heap: list[tuple[tuple, int, dict[str, int]]] = []
+            for item in ranked:
+                if len(heap) < limit:
+                    heapq.heappush(heap, item)
+                elif item[0] > heap[0][0]:
+                    heapq.heapreplace(heap, item)
+            best = sorted(heap, key=lambda item: item[0], reverse=True)
+        return [(key[0], detail_id, matches) for key, detail_id, matches in best]
+
+    @classmethod
+    def _score_exact(cls, keywords: list[str], counts: dict[int, dict[str, int]], detail_ids: Iterable[tuple[int, int]]) -> Iterator[tuple[tuple, int, dict[str, int]]]:
+        # The one exact scoring rule: total hits, plus ALL_KEYWORDS_BONUS for a
+        # CV holding every keyword. Takes (position, detail_id) pairs and
+        # yields _top items for the CVs that score.
+        for position, detail_id in detail_ids:
+            matches = counts.get(detail_id, {})
+            score = sum(matches.values())
+            if all(keyword in matches for keyword in keywords):
+                score += cls.ALL_KEYWORDS_BONUS
+            elif not matches:
+                continue
+            yield (score, -position), detail_id, matches
+
+    def rank_exact(self, keywords: list[str], counts: dict[int, dict[str, int]], limit: Optional[int] = None) -> list[tuple[int, int, dict[str, int]]]:
+        detail_ids = enumerate(application_pdf.detail_id for _, _, application_pdf in self.entries)
+        return self._top(self._score_exact(keywords, counts, detail_ids), limit)
+
+    def rank_fuzzy(self, keywords: list[str], exclude: set[int], limit: Optional[int] = None, token: Optional[CancellationToken] = None) -> list[tuple[int, int, dict[str, int]]]:
+        if limit is not None and limit <= 0:
+            return []
+
+        # A fuzzy candidate needs every keyword within FUZZY_LIMIT, so each
+        # lookup only looks at the documents the previous ones left, and an
+        # empty set ends the phase before the remaining BK-tree searches.
+        candidates = {detail_id for detail_id in self.positions if detail_id not in exclude}
+        lookups = {}
+        for keyword in keywords:
+            if token is not None:
+                token.raise_if_cancelled()
+            lookups[keyword] = self.inverted_index.fuzzy_lookup(keyword, self.FUZZY_LIMIT, candidates)
+            candidates = set(lookups[keyword])
+            if not candidates:
+                return []
+
+        def scored():
+            for detail_id in candidates:
+                distances = {keyword: lookups[keyword][detail_id] for keyword in keywords}
+                yield (-sum(distances.values()), -self.positions[detail_id]), detail_id, distances
+        return [(-score, detail_id, distances) for score, detail_id, distances in self._top(scored(), limit)]
+
+    def _to_result(self, detail_id: int, matches: dict[str, int]) -> SearchResult:
+        applicant, application_detail, application_pdf = self.entries_by_id[detail_id]
+        return SearchResult(applicant, application_detail, application_pdf, matches)
+
+    def match_exact(self, algorithm: str, keywords: list[str], limit: Optional[int] = None, use_process_pool: bool = False) -> list[SearchResult]:
+        counts = self.count_matches(keywords, algorithm, use_process_pool, limit)
+        ranked = self.rank_exact(keywords, counts, limit)
+        return [self._to_result(detail_id, matches) for _, detail_id, matches in ranked]
+
+    def match_fuzzy(self, keywords: list[str], limit: Optional[int] = None, exclude: Optional[set[int]] = None) -> list[SearchResult]:
+        ranked = self.rank_fuzzy(keywords, exclude or set(), limit)
+        return [self._to_result(detail_id, distances) for _, detail_id, distances in ranked]
+
+    def search(self, keywords: list[str], algorithm: str = "KMP", fuzzy: bool = True, limit: int = 10, use_process_pool: bool = False, incremental: bool = False, on_progress: Optional[Callable[[list[SearchResult], int, int], None]] = None, token: Optional[CancellationToken] = None) -> list[SearchResult]:
+        algorithm = self.ALIASES.get(algorithm, algorithm)
+        key = (frozenset(keywords), algorithm, fuzzy)
+        version = self.corpus_version()
+
+        if self.cache is not None:
+            # A ranking for a larger limit starts with the ranking for any
+            # smaller one, and a short ranking already holds every result.
+            cached = self.cache.get(key, version, lambda entry: entry[0] >= limit or len(entry[1]) < entry[0])
+            if cached is not None:
+                return [self._to_result(detail_id, matches) for _, detail_id, matches in cached[1][:limit]]
+
+        progress = None
+        if on_progress is not None:
+            # Ranks the partial counts into a provisional top k, at most once
+            # per PROGRESS_INTERVAL; skipped reports cost nothing. The scan
+            # keeps filling the count dicts, so the results get copies.
+            last_report = [float("-inf")]
+
+            def progress(partial: dict[int, dict[str, int]], done: int, total: int) -> None:
+                now = time.monotonic()
+                if (keywords and not partial) or now - last_report[0] < self.PROGRESS_INTERVAL:
+                    return
+                last_report[0] = now
+                ranked = self.rank_exact(keywords, partial, limit)
+                on_progress([self._to_result(detail_id, dict(matches)) for _, detail_id, matches in ranked], done, total)
+
+        if incremental:
+            counts = self.count_incremental(keywords, algorithm, use_process_pool, token)
+        else:
+            counts = self.count_matches(keywords, algorithm, use_process_pool, limit, progress, token)
+        # Two phases: the exact ranking is finished first, and the fuzzy phase
+        # only runs for the slots it left open, over the CVs it did not take.
+        ranked = self.rank_exact(keywords, counts, limit)
+        remaining = limit - len(ranked)
+        if fuzzy and keywords and remaining > 0:
+            # Fewer than `limit` exact hits means the scan was not cut short,
+            # so every CV with an exact hit is in `counts`.
+            ranked += self.rank_fuzzy(keywords, set(counts), remaining, token)
+
+        if self.cache is not None:
+            self.cache.put(key, version, (limit, ranked))
+        return [self._to_result(detail_id, matches) for _, detail_id, matches in ranked]
+
+    @classmethod
+    def _compile_chunk_counter(cls, keywords: list[str], algorithm: str) -> Callable[[list[tuple[int, str]]], dict[int, dict[str, int]]]:
+        algorithm = cls.ALIASES.get(algorithm, algorithm)
+        if algorithm in cls.CORPUS:
+            # A suffix array over a chunk that is dropped right away costs far
+            # more to build than it saves, and counts the same as the batch
+            # matcher, so both corpus algorithms use BatchMatcher here.
+            return lambda documents: cls._count_corpus(BatchMatcher([text for _, text in documents]), documents, keywords)
+        scan = Scanner.compile(algorithm, keywords, cls.OVERLAPPING_MATCHES)
+        return lambda documents: Scanner.count(scan, documents)
+
+    @classmethod
+    def search_stream(cls, chunks: Iterable[list[tuple[int, str]]], keywords: list[str], algorithm: str = "KMP", fuzzy: bool = True, limit: int = 10, token: Optional[CancellationToken] = None) -> list[tuple[int, int, dict[str, int]]]:
+        # Ranks a corpus that never sits in memory as a whole: chunks of
+        # (detail_id, cv_text) are counted and dropped one at a time, and only
+        # the best `limit` rows survive. Returns (score, detail_id, matches)
+        # rows, fuzzy ones carrying distances, for the caller to load.
+        count_chunk = cls._compile_chunk_counter(keywords, algorithm)
+        fuzzy_matchers = [(keyword, PatternMatching.compile_myers(keyword), {}) for keyword in keywords]
+        exact: list[tuple[tuple, int, dict[str, int]]] = []
+        close: list[tuple[tuple, int, dict[str, int]]] = []
+        position = 0
+
+        # The token is checked before each page is requested, so a cancelled
+        # search sends no further queries.
+        chunks = iter(chunks)
+        while True:
+            if token is not None:
+                token.raise_if_cancelled()
+            documents = next(chunks, None)
+            if documents is None:
+                break
+            counts = count_chunk(documents)
+            detail_ids = enumerate((detail_id for detail_id, _ in documents), position)
+            exact = cls._merge_top(exact, list(cls._score_exact(keywords, counts, detail_ids)), limit)
+
+            # Fuzzy rows are only shown when fewer than `limit` CVs hit
+            # exactly, so the fuzzy work stops once the exact top k is full.
+            # Each CV is checked on its own tokens; a token's distance is
+            # computed once per query and reused by every later CV.
+            if fuzzy and keywords and len(exact) < limit:
+                scored = []
+                for offset, (detail_id, text) in enumerate(documents):
+                    if detail_id in counts:
+                        continue
+                    words = set(InvertedIndex.TOKEN_PATTERN.findall(text))
+                    distances = {}
+                    for keyword, myers, known in fuzzy_matchers:
+                        if len(known) >= cls.FUZZY_MEMO_SIZE:
+                            known.clear()
+                        best = myers.min_word_distance(words, cls.FUZZY_LIMIT, known)
+                        if best is None:
+                            break
+                        distances[keyword] = best
+                    else:
+                        scored.append(((-sum(distances.values()), -(position + offset)), detail_id, distances))
+                close = cls._merge_top(close, scored, limit)
+            position += len(documents)
+
+        ranked = cls._top(exact, limit)
+        if fuzzy and keywords and len(ranked) < limit:
+            ranked += [(-score, detail_id, distances) for score, detail_id, distances in cls._top(close, limit - len(ranked))]
+        return ranked
+
+    @staticmethod
+    def _merge_top(best: list, items: list, limit: int) -> list:
+        return heapq.nlargest(limit, best + items, key=lambda item: item[0])
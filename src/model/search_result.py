@@ -4,6 +4,10 @@ from src.model.application_detail import ApplicationDetail
 from src.utils.regex import Regex, Summary
 
 class SearchResult:
+    # Summaries by detail_id, shared across queries. The cv_raw they came from
+    # is kept alongside so an edited CV is summarized again.
+    _summaries: dict[int, tuple[str, Summary]] = {}
+
     def __init__(self, 
                 applicant_profile: ApplicantProfile, 
                 application_detail: ApplicationDetail,
@@ -12,5 +16,13 @@ class SearchResult:
         self.applicant_profile = applicant_profile
         self.application_detail = application_detail
         self.pdf = application_pdf
-        self.summary = Regex.extract_summary(self.pdf.cv_raw)
         self.matches = matches
+
+    @property
+    def summary(self) -> Summary:
+        # Extracted on first access only; searches never pay for the regexes.
+        cached = SearchResult._summaries.get(self.pdf.detail_id)
+        if cached is None or cached[0] != self.pdf.cv_raw:
+            cached = (self.pdf.cv_raw, Regex.extract_summary(self.pdf.cv_raw))
+            SearchResult._summaries[self.pdf.detail_id] = cached
+        return cached[1]
@@ -0,0 +1,78 @@
+import numpy as np
+from typing import Optional
+from src.utils.pattern_matching import PatternMatching
+
+class BatchMatcher:
+    # Every document is packed into one contiguous code-point buffer, joined by
+    # a separator that keywords never contain, so a match can't cross documents.
+    SEPARATOR = "\0"
+
+    def __init__(self, texts: list[str]):
+        self.size = len(texts)
+        self.is_ascii = all(text.isascii() for text in texts)
+        self.buffer = self._encode(self.SEPARATOR.join(texts))
+
+        lengths = np.fromiter((len(text) + 1 for text in texts), dtype=np.int64, count=self.size)
+        self.offsets = np.cumsum(lengths) - lengths
+
+    def _encode(self, text: str) -> np.ndarray:
+        if self.is_ascii:
+            return np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+    def _encode_keyword(self, keyword: str) -> Optional[np.ndarray]:
+        if self.SEPARATOR in keyword or (self.is_ascii and not keyword.isascii()):
+            return None
+        return self._encode(keyword)
+
+    def _find(self, codes: np.ndarray) -> np.ndarray:
+        # Filter on the first and last character, then verify the inner
+        # characters one column at a time over the surviving candidates only.
+        buffer = self.buffer
+        n = len(buffer)
+        m = len(codes)
+        mask = buffer[:n - m + 1] == codes[0]
+        if m > 1:
+            mask &= buffer[m - 1:] == codes[-1]
+        candidates = np.flatnonzero(mask)
+        for j in range(1, m - 1):
+            if not candidates.size:
+                break
+            candidates = candidates[buffer[candidates + j] == codes[j]]
+        return candidates
+
+    def positions(self, keyword: str, overlapping: bool = False) -> np.ndarray:
+        codes = self._encode_keyword(keyword)
+        if codes is None or len(codes) == 0 or len(codes) > len(self.buffer):
+            return np.empty(0, dtype=np.int64)
+
+        m = len(codes)
+        candidates = self._find(codes)
+
+        # Occurrences can only overlap when the keyword has a border.
+        if overlapping or candidates.size < 2 or PatternMatching.compile_kmp(keyword).lps[-1] == 0:
+            return candidates
+
+        kept = []
+        free_from = -1
+        for pos in candidates.tolist():
+            if pos >= free_from:
+                kept.append(pos)
+                free_from = pos + m
+        return np.asarray(kept, dtype=np.int64)
+
+    def count(self, keywords: list[str], overlapping: bool = False) -> np.ndarray:
+        counts = np.zeros((self.size, len(keywords)), dtype=np.int64)
+        for k, keyword in enumerate(keywords):
+            positions = self.positions(keyword, overlapping)
+            if positions.size:
+                documents = np.searchsorted(self.offsets, positions, side="right") - 1
+                counts[:, k] = np.bincount(documents, minlength=self.size)
+        return counts
+
+    def count_dicts(self, keywords: list[str], overlapping: bool = False) -> list[dict[str, int]]:
+        counts = self.count(keywords, overlapping)
+        return [
+            {keyword: int(count) for keyword, count in zip(keywords, row) if count}
+            for row in counts.tolist()
+        ]
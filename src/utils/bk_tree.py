@@ -0,0 +1,46 @@
+from src.utils.pattern_matching import PatternMatching
+
+class BKTree:
+    # Burkhard-Keller tree under Levenshtein distance. Each node is a
+    # (term, {distance: child}) pair; by the triangle inequality a query with
+    # radius k only needs children whose edge distance is within d +- k.
+    def __init__(self):
+        self.root: tuple[str, dict] | None = None
+        self.size = 0
+
+    def add(self, term: str) -> None:
+        if self.root is None:
+            self.root = (term, {})
+            self.size = 1
+            return
+
+        matcher = PatternMatching.compile_myers(term)
+        node = self.root
+        while True:
+            dist = matcher.distance(node[0])
+            if dist == 0:
+                return
+            child = node[1].get(dist)
+            if child is None:
+                node[1][dist] = (term, {})
+                self.size += 1
+                return
+            node = child
+
+    def search(self, term: str, limit: int) -> list[tuple[str, int]]:
+        if self.root is None:
+            return []
+
+        matcher = PatternMatching.compile_myers(term)
+        found = []
+        stack = [self.root]
+        while stack:
+            node_term, children = stack.pop()
+            dist = matcher.distance(node_term)
+            if dist <= limit:
+                found.append((node_term, dist))
+            for edge, child in children.items():
+                if dist - limit <= edge <= dist + limit:
+                    stack.append(child)
+        found.sort(key=lambda hit: (hit[1], hit[0]))
+        return found
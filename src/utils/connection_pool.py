@@ -0,0 +1,108 @@
+import threading
+import time
+from typing import Any, Callable, Optional
+
+class ConnectionPool:
+    # At most `size` connections, opened on demand. acquire() blocks until one
+    # is idle or `timeout` seconds pass, and the wait is recorded so the pool
+    # can be sized from stats(). `reset` runs on every released connection
+    # (e.g. a rollback) so no transaction is handed on to the next borrower.
+    def __init__(self, connect: Callable[[], Any], size: int, timeout: float = 10.0, reset: Optional[Callable[[Any], None]] = None):
+        self.connect = connect
+        self.reset = reset
+        self.size = size
+        self.timeout = timeout
+        self.idle: list[Any] = []
+        self.condition = threading.Condition()
+        self.closed = False
+
+        self.created = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def acquire(self) -> Any:
+        start = time.monotonic()
+        with self.condition:
+            while not self.idle and self.created >= self.size:
+                if self.closed:
+                    raise RuntimeError("Connection pool is closed.")
+                remaining = self.timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise TimeoutError(f"No connection available after {self.timeout} seconds ({self.size} in use).")
+                self.condition.wait(remaining)
+            if self.closed:
+                raise RuntimeError("Connection pool is closed.")
+
+            conn = self.idle.pop() if self.idle else None
+            if conn is None:
+                self.created += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+        if conn is None:
+            try:
+                conn = self.connect()
+            except Exception:
+                with self.condition:
+                    self.created -= 1
+                    self.in_use -= 1
+                    self.condition.notify()
+                raise
+
+        wait = time.monotonic() - start
+        with self.condition:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        return conn
+
+    def release(self, conn: Any) -> None:
+        broken = False
+        if self.reset is not None:
+            try:
+                self.reset(conn)
+            except Exception:
+                broken = True
+        with self.condition:
+            self.in_use -= 1
+            discard = self.closed or broken
+            if discard:
+                self.created -= 1
+            else:
+                self.idle.append(conn)
+            self.condition.notify()
+        if discard:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        # Idle connections are closed now, checked-out ones when released.
+        with self.condition:
+            self.closed = True
+            for conn in self.idle:
+                conn.close()
+            self.created -= len(self.idle)
+            self.idle.clear()
+            self.condition.notify_all()
+
+    def stats(self) -> dict[str, float]:
+        with self.condition:
+            return {
+                "size": self.size,
+                "created": self.created,
+                "idle": len(self.idle),
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait": self.total_wait,
+                "max_wait": self.max_wait,
+                "avg_wait": self.total_wait / self.checkouts if self.checkouts else 0.0,
+            }
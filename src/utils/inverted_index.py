@@ -0,0 +1,100 @@
+import re
+from collections import Counter
+from typing import Callable, Iterable, Optional
+from src.utils.bk_tree import BKTree
+from src.utils.search_scheduler import CancellationToken
+
+class InvertedIndex:
+    # A keyword made only of word characters can never span two tokens, so its
+    # count in a document is the sum over the tokens containing it of
+    # (term frequency * occurrences inside the token). Anything else falls
+    # back to verifying the documents that contain all of its word tokens.
+    TOKEN_PATTERN = re.compile(r"\w+")
+
+    def __init__(self):
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+        self.texts: dict[int, str] = {}
+        self.vocabulary: BKTree | None = None
+
+    @staticmethod
+    def build(documents: Iterable[tuple[int, str]]) -> "InvertedIndex":
+        index = InvertedIndex()
+        for detail_id, text in documents:
+            index.add(detail_id, text)
+        return index
+
+    def add(self, detail_id: int, text: str) -> None:
+        self.texts[detail_id] = text
+        for token, frequency in Counter(self.TOKEN_PATTERN.findall(text)).items():
+            self.postings.setdefault(token, []).append((detail_id, frequency))
+        self.vocabulary = None
+
+    def lookup(self, token: str) -> list[tuple[int, int]]:
+        return self.postings.get(token, [])
+
+    def vocabulary_containing(self, fragment: str) -> list[str]:
+        return [token for token in self.postings if fragment in token]
+
+    def is_single_token(self, keyword: str) -> bool:
+        return self.TOKEN_PATTERN.fullmatch(keyword) is not None
+
+    def candidates(self, keyword: str) -> set[int]:
+        result = None
+        for fragment in self.TOKEN_PATTERN.findall(keyword):
+            found = {
+                detail_id
+                for token in self.vocabulary_containing(fragment)
+                for detail_id, _ in self.postings[token]
+            }
+            result = found if result is None else result & found
+            if not result:
+                return set()
+        return set(self.texts) if result is None else result
+
+    def count(self, matcher) -> dict[int, int]:
+        counts: dict[int, int] = {}
+        if self.is_single_token(matcher.pattern):
+            for token in self.vocabulary_containing(matcher.pattern):
+                in_token = matcher.count(token)
+                for detail_id, frequency in self.postings[token]:
+                    counts[detail_id] = counts.get(detail_id, 0) + in_token * frequency
+            return counts
+
+        for detail_id in self.candidates(matcher.pattern):
+            found = matcher.count(self.texts[detail_id])
+            if found:
+                counts[detail_id] = found
+        return counts
+
+    def expand(self, keyword: str, limit: int = 2) -> list[tuple[str, int]]:
+        # The BK-tree is only needed by fuzzy search, so it is built on the
+        # first expansion after the postings change.
+        if self.vocabulary is None:
+            vocabulary = BKTree()
+            for token in self.postings:
+                vocabulary.add(token)
+            self.vocabulary = vocabulary
+        return self.vocabulary.search(keyword, limit)
+
+    def fuzzy_lookup(self, keyword: str, limit: int = 2, within: Optional[set[int]] = None) -> dict[int, int]:
+        # Smallest distance from the keyword to any token of each document,
+        # for the documents that have a token within `limit` edits.
+        distances: dict[int, int] = {}
+        for term, dist in self.expand(keyword, limit):
+            for detail_id, _ in self.postings[term]:
+                if within is not None and detail_id not in within:
+                    continue
+                if dist < distances.get(detail_id, limit + 1):
+                    distances[detail_id] = dist
+        return distances
+
+    def count_all(self, matchers: list, progress: Optional[Callable[[dict[int, dict[str, int]], int, int], None]] = None, token: Optional[CancellationToken] = None) -> dict[int, dict[str, int]]:
+        matches: dict[int, dict[str, int]] = {}
+        for done, matcher in enumerate(matchers, 1):
+            if token is not None:
+                token.raise_if_cancelled()
+            for detail_id, found in self.count(matcher).items():
+                matches.setdefault(detail_id, {})[matcher.pattern] = found
+            if progress is not None:
+                progress(matches, done, len(matchers))
+        return matches
@@ -1,68 +1,423 @@
 import time
-
-class PatternMatching:
-    @staticmethod
-    def kmp(text: str, pattern: str) -> int:
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+
+# Every single-pattern matcher counts occurrences the same way: with
+# overlapping=False a match consumes its characters ("aaaa" holds "aa" twice),
+# with overlapping=True every start position counts ("aaaa" holds "aa" 3 times).
+# finditer() lazily yields (keyword, start, end) and stops after `limit` hits;
+# count() is built on it, so counting and highlighting never disagree.
+@dataclass(frozen=True, slots=True)
+class KMPMatcher:
+    pattern: str
+    lps: tuple[int, ...]
+    overlapping: bool = False
+
+    def finditer(self, text: str, limit: Optional[int] = None) -> Iterator[tuple[str, int, int]]:
+        pattern = self.pattern
+        lps = self.lps
         n = len(text)
         m = len(pattern)
-        if m == 0 or n == 0 or m > n:
-            return 0
-
-        lps = [0] * m
-        length = 0
-        i = 1
-        while i < m:
-            if pattern[i] == pattern[length]:
-                length += 1
-                lps[i] = length
-                i += 1
-            else:
-                if length != 0:
-                    length = lps[length - 1]
-                else:
-                    lps[i] = 0
-                    i += 1
+        if m == 0 or n == 0 or m > n or limit == 0:
+            return
 
         i = j = 0
-        count = 0
+        found = 0
         while i < n:
             if pattern[j] == text[i]:
                 i += 1
                 j += 1
 
             if j == m:
-                count += 1
-                j = lps[j - 1]
+                yield pattern, i - m, i
+                found += 1
+                if found == limit:
+                    return
+                j = lps[j - 1] if self.overlapping else 0
             elif i < n and pattern[j] != text[i]:
                 if j != 0:
                     j = lps[j - 1]
                 else:
                     i += 1
-        return count
 
-    @staticmethod
-    def bm(text: str, pattern: str) -> int:
+    def count(self, text: str) -> int:
+        return sum(1 for _ in self.finditer(text))
+
+
+@dataclass(frozen=True, slots=True)
+class BMMatcher:
+    pattern: str
+    last: dict[str, int]
+    good_suffix: tuple[int, ...]
+    overlapping: bool = False
+
+    def finditer(self, text: str, limit: Optional[int] = None) -> Iterator[tuple[str, int, int]]:
+        pattern = self.pattern
+        last = self.last
+        good_suffix = self.good_suffix
         n = len(text)
         m = len(pattern)
-        if m == 0 or m > n:
-            return 0
+        if m == 0 or m > n or limit == 0:
+            return
 
-        skip = {pattern[i]: m - i - 1 for i in range(m - 1)}
-        count = 0
+        after_match = good_suffix[0] if self.overlapping else m
+        found = 0
         i = 0
+        while i <= n - m:
+            j = m - 1
+            while j >= 0 and pattern[j] == text[i + j]:
+                j -= 1
+            if j < 0:
+                yield pattern, i, i + m
+                found += 1
+                if found == limit:
+                    return
+                i += after_match
+            else:
+                bad_char = j - last.get(text[i + j], -1)
+                i += max(good_suffix[j + 1], bad_char)
+
+    def count(self, text: str) -> int:
+        return sum(1 for _ in self.finditer(text))
+
 
+@dataclass(frozen=True, slots=True)
+class HorspoolMatcher:
+    pattern: str
+    skip: dict[str, int]
+    overlapping: bool = False
+
+    def finditer(self, text: str, limit: Optional[int] = None) -> Iterator[tuple[str, int, int]]:
+        pattern = self.pattern
+        skip = self.skip
+        n = len(text)
+        m = len(pattern)
+        if m == 0 or m > n or limit == 0:
+            return
+
+        found = 0
+        i = 0
         while i <= n - m:
             j = m - 1
             while j >= 0 and pattern[j] == text[i + j]:
                 j -= 1
             if j < 0:
-                count += 1
-                i += m
+                yield pattern, i, i + m
+                found += 1
+                if found == limit:
+                    return
+                if not self.overlapping:
+                    i += m
+                    continue
+            i += skip.get(text[i + m - 1], m)
+
+    def count(self, text: str) -> int:
+        return sum(1 for _ in self.finditer(text))
+
+
+@dataclass(frozen=True, slots=True)
+class SundayMatcher:
+    pattern: str
+    shift: dict[str, int]
+    overlapping: bool = False
+
+    def finditer(self, text: str, limit: Optional[int] = None) -> Iterator[tuple[str, int, int]]:
+        pattern = self.pattern
+        shift = self.shift
+        n = len(text)
+        m = len(pattern)
+        if m == 0 or m > n or limit == 0:
+            return
+
+        found = 0
+        i = 0
+        while i <= n - m:
+            if text.startswith(pattern, i):
+                yield pattern, i, i + m
+                found += 1
+                if found == limit:
+                    return
+                if not self.overlapping:
+                    i += m
+                    continue
+            if i + m >= n:
+                break
+            i += shift.get(text[i + m], m + 1)
+
+    def count(self, text: str) -> int:
+        return sum(1 for _ in self.finditer(text))
+
+
+@dataclass(frozen=True, slots=True)
+class MyersMatcher:
+    # Myers' bit-vector edit distance: column j of the DP table is encoded as
+    # +1/-1 vertical deltas in the bits of Python ints, so a word costs one
+    # handful of integer ops per character instead of an O(m) inner loop.
+    pattern: str
+    peq: dict[str, int]
+
+    def distance(self, word: str) -> int:
+        m = len(self.pattern)
+        if m == 0:
+            return len(word)
+
+        peq_get = self.peq.get
+        full = (1 << m) - 1
+        high = 1 << (m - 1)
+        pv = full
+        mv = 0
+        score = m
+        for char in word:
+            eq = peq_get(char, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & full)
+            mh = pv & xh
+            if ph & high:
+                score += 1
+            elif mh & high:
+                score -= 1
+            ph = ((ph << 1) | 1) & full
+            mh = (mh << 1) & full
+            pv = mh | (~(xv | ph) & full)
+            mv = ph & xv
+        return score
+
+    def min_distance(self, text: str, limit: int = 5) -> Optional[int]:
+        return self.min_word_distance(set(text.split()), limit)
+
+    def min_word_distance(self, words: Iterable[str], limit: int = 5, memo: Optional[dict[str, int]] = None) -> Optional[int]:
+        # `memo` maps words to their distance and is filled as words are
+        # measured, so a caller checking many documents measures each word once.
+        m = len(self.pattern)
+        min_dist = limit + 1
+        for word in words:
+            if abs(len(word) - m) >= min_dist:
+                continue
+            dist = memo.get(word) if memo is not None else None
+            if dist is None:
+                dist = self.distance(word)
+                if memo is not None:
+                    memo[word] = dist
+            if dist < min_dist:
+                min_dist = dist
+                if dist == 0:
+                    break
+        return min_dist if min_dist <= limit else None
+
+
+@dataclass(frozen=True, slots=True)
+class AhoCorasickAutomaton:
+    # Dense DFA over the keywords' alphabet. States are stored as row offsets
+    # into `delta`, so one transition is a single array lookup.
+    patterns: tuple[str, ...]
+    alphabet: dict[str, int]
+    other: int
+    delta: array
+    outputs: dict[int, tuple[int, ...]]
+    overlapping: bool = True
+
+    def finditer(self, text: str, limit: Optional[int] = None) -> Iterator[tuple[str, int, int]]:
+        if limit == 0:
+            return
+        patterns = self.patterns
+        alphabet_get = self.alphabet.get
+        other = self.other
+        delta = self.delta
+        outputs_get = self.outputs.get
+        lengths = [len(pattern) for pattern in patterns]
+        free_from = [0] * len(patterns)
+        overlapping = self.overlapping
+
+        found = 0
+        state = 0
+        for pos, char in enumerate(text):
+            state = delta[state + alphabet_get(char, other)]
+            hits = outputs_get(state)
+            if hits:
+                for index in hits:
+                    start = pos - lengths[index] + 1
+                    if not overlapping:
+                        if start < free_from[index]:
+                            continue
+                        free_from[index] = pos + 1
+                    yield patterns[index], start, pos + 1
+                    found += 1
+                    if found == limit:
+                        return
+
+    def scan(self, text: str) -> tuple[int, dict[str, int]]:
+        if not self.overlapping:
+            counts = dict.fromkeys(self.patterns, 0)
+            for keyword, _, _ in self.finditer(text):
+                counts[keyword] += 1
+            match_dict = {pattern: count for pattern, count in counts.items() if count}
+            return sum(match_dict.values()), match_dict
+
+        # Counting every hit needs no positions, so skip the generator.
+        alphabet_get = self.alphabet.get
+        other = self.other
+        delta = self.delta
+        outputs_get = self.outputs.get
+        counts = [0] * len(self.patterns)
+
+        state = 0
+        for char in text:
+            state = delta[state + alphabet_get(char, other)]
+            hits = outputs_get(state)
+            if hits:
+                for index in hits:
+                    counts[index] += 1
+
+        match_dict = {pattern: count for pattern, count in zip(self.patterns, counts) if count}
+        return sum(counts), match_dict
+
+
+@dataclass(frozen=True, slots=True)
+class WuManberMatcher:
+    # Multi-pattern window of length `shortest`; the last `block` characters
+    # of the window pick a shift, and only a zero shift triggers verification
+    # of the patterns whose prefix ends with that block.
+    patterns: tuple[str, ...]
+    shortest: int
+    block: int
+    shift: dict[str, int]
+    candidates: dict[str, tuple[int, ...]]
+    overlapping: bool = True
+
+    def finditer(self, text: str, limit: Optional[int] = None) -> Iterator[tuple[str, int, int]]:
+        patterns = self.patterns
+        if not patterns or limit == 0:
+            return
+        shortest = self.shortest
+        block = self.block
+        shift_get = self.shift.get
+        candidates = self.candidates
+        default_shift = shortest - block + 1
+        free_from = [0] * len(patterns)
+        overlapping = self.overlapping
+
+        found = 0
+        n = len(text)
+        pos = shortest - 1
+        while pos < n:
+            key = text[pos - block + 1:pos + 1]
+            step = shift_get(key, default_shift)
+            if step == 0:
+                start = pos - shortest + 1
+                for index in candidates[key]:
+                    pattern = patterns[index]
+                    if not text.startswith(pattern, start):
+                        continue
+                    if not overlapping:
+                        if start < free_from[index]:
+                            continue
+                        free_from[index] = start + len(pattern)
+                    yield pattern, start, start + len(pattern)
+                    found += 1
+                    if found == limit:
+                        return
+                step = 1
+            pos += step
+
+    def scan(self, text: str) -> tuple[int, dict[str, int]]:
+        counts = dict.fromkeys(self.patterns, 0)
+        for keyword, _, _ in self.finditer(text):
+            counts[keyword] += 1
+        match_dict = {pattern: count for pattern, count in counts.items() if count}
+        return sum(match_dict.values()), match_dict
+
+
+class PatternMatching:
+    # Compiled matchers hold only read-only tables, so one instance per query
+    # can be shared by every worker thread.
+    @staticmethod
+    def compile_kmp(pattern: str, overlapping: bool = False) -> KMPMatcher:
+        m = len(pattern)
+        lps = [0] * m
+        length = 0
+        i = 1
+        while i < m:
+            if pattern[i] == pattern[length]:
+                length += 1
+                lps[i] = length
+                i += 1
             else:
-                next_char = text[i + m - 1]
-                i += skip.get(next_char, m)
-        return count
+                if length != 0:
+                    length = lps[length - 1]
+                else:
+                    lps[i] = 0
+                    i += 1
+        return KMPMatcher(pattern, tuple(lps), overlapping)
+
+    @staticmethod
+    def compile_bm(pattern: str, overlapping: bool = False) -> BMMatcher:
+        m = len(pattern)
+        last = {char: i for i, char in enumerate(pattern)}
+
+        # Strong good-suffix rule: shift[j] is how far to move when the
+        # mismatch happens at pattern[j - 1], shift[0] after a full match.
+        shift = [0] * (m + 1)
+        border = [0] * (m + 1)
+        i = m
+        j = m + 1
+        border[i] = j
+        while i > 0:
+            while j <= m and pattern[i - 1] != pattern[j - 1]:
+                if shift[j] == 0:
+                    shift[j] = j - i
+                j = border[j]
+            i -= 1
+            j -= 1
+            border[i] = j
+
+        j = border[0]
+        for i in range(m + 1):
+            if shift[i] == 0:
+                shift[i] = j
+            if i == j:
+                j = border[j]
+        return BMMatcher(pattern, last, tuple(shift), overlapping)
+
+    @staticmethod
+    def compile_horspool(pattern: str, overlapping: bool = False) -> HorspoolMatcher:
+        m = len(pattern)
+        skip = {pattern[i]: m - i - 1 for i in range(m - 1)}
+        return HorspoolMatcher(pattern, skip, overlapping)
+
+    @staticmethod
+    def compile_sunday(pattern: str, overlapping: bool = False) -> SundayMatcher:
+        m = len(pattern)
+        shift = {char: m - i for i, char in enumerate(pattern)}
+        return SundayMatcher(pattern, shift, overlapping)
+
+    @staticmethod
+    def kmp(text: str, pattern: str, overlapping: bool = False) -> int:
+        return PatternMatching.compile_kmp(pattern, overlapping).count(text)
+
+    @staticmethod
+    def bm(text: str, pattern: str, overlapping: bool = False) -> int:
+        return PatternMatching.compile_bm(pattern, overlapping).count(text)
+
+    @staticmethod
+    def horspool(text: str, pattern: str, overlapping: bool = False) -> int:
+        return PatternMatching.compile_horspool(pattern, overlapping).count(text)
+
+    @staticmethod
+    def sunday(text: str, pattern: str, overlapping: bool = False) -> int:
+        return PatternMatching.compile_sunday(pattern, overlapping).count(text)
     
+    @staticmethod
+    def finditer_kmp(text: str, pattern: str, limit: Optional[int] = None, overlapping: bool = False) -> Iterator[tuple[str, int, int]]:
+        return PatternMatching.compile_kmp(pattern, overlapping).finditer(text, limit)
+
+    @staticmethod
+    def finditer_bm(text: str, pattern: str, limit: Optional[int] = None, overlapping: bool = False) -> Iterator[tuple[str, int, int]]:
+        return PatternMatching.compile_bm(pattern, overlapping).finditer(text, limit)
+
     @staticmethod
     def ld(text: str, pattern: str) -> int:
         n = len(text)
@@ -137,53 +492,135 @@ class PatternMatching:
 
     
     @staticmethod
-    def aho_corasick(text: str, patterns: list[str]) -> tuple[int, dict[str, int]]:
-        from collections import deque, defaultdict
+    def approx_search(text: str, pattern: str, k: int = 2) -> tuple[Optional[int], list[int]]:
+        # Sellers' DP: row 0 is always 0, so an occurrence may start anywhere.
+        # Ukkonen's cutoff only evaluates rows up to the last one still <= k,
+        # which keeps the expected cost at O(k * n). Offsets are match ends.
+        n = len(text)
+        m = len(pattern)
+        if m == 0 or n == 0:
+            return None, []
+
+        col = list(range(m + 1))
+        top = min(k, m)
+        best = k + 1
+        ends = []
+
+        for pos in range(n):
+            char = text[pos]
+            diag = 0
+            left = 0
+            # The last active row can only move down by one per column.
+            top = min(top + 1, m)
+            for i in range(1, top + 1):
+                up = col[i]
+                if pattern[i - 1] == char:
+                    left = diag
+                else:
+                    left = min(diag, up, left) + 1
+                diag = up
+                col[i] = left
+
+            while col[top] > k:
+                top -= 1
+            if top == m:
+                ends.append(pos + 1)
+                if col[m] < best:
+                    best = col[m]
 
-        class Node:
-            def __init__(self):
-                self.children = {}
-                self.fail = None
-                self.output = set()
+        return (best if best <= k else None), ends
+
+    @staticmethod
+    def compile_myers(pattern: str) -> MyersMatcher:
+        peq: dict[str, int] = {}
+        for i, char in enumerate(pattern):
+            peq[char] = peq.get(char, 0) | (1 << i)
+        return MyersMatcher(pattern, peq)
+
+    @staticmethod
+    def myers_min_ld(text: str, pattern: str, limit: int = 5) -> Optional[int]:
+        return PatternMatching.compile_myers(pattern).min_distance(text, limit)
 
-        root = Node()
+    @staticmethod
+    def compile_aho_corasick(patterns: list[str], overlapping: bool = True) -> AhoCorasickAutomaton:
+        keywords = tuple(dict.fromkeys(p for p in patterns if p))
 
-        for pattern in patterns:
-            node = root
+        goto: list[dict[str, int]] = [{}]
+        out: list[list[int]] = [[]]
+        for index, pattern in enumerate(keywords):
+            state = 0
             for char in pattern:
-                if char not in node.children:
-                    node.children[char] = Node()
-                node = node.children[char]
-            node.output.add(pattern)
-
-        queue = deque()
-        for child in root.children.values():
-            child.fail = root
-            queue.append(child)
-
-        while queue:
-            current = queue.popleft()
-            for key, child in current.children.items():
-                fail_node = current.fail
-                while fail_node and key not in fail_node.children:
-                    fail_node = fail_node.fail
-                child.fail = fail_node.children[key] if fail_node and key in fail_node.children else root
-                child.output |= child.fail.output
-                queue.append(child)
-
-        node = root
-        match_count = 0
-        match_dict: dict[str, int] = defaultdict(int)
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(index)
+
+        alphabet_chars = sorted({char for pattern in keywords for char in pattern})
+        sigma = len(alphabet_chars)
+        width = sigma + 1  # last column catches characters outside the alphabet
+        alphabet = {char: col for col, char in enumerate(alphabet_chars)}
+
+        fail = [0] * len(goto)
+        delta = array("l", bytes(len(goto) * width * array("l").itemsize))
+        order = deque()
+        for char, child in goto[0].items():
+            delta[alphabet[char]] = child * width
+            order.append(child)
+
+        while order:
+            state = order.popleft()
+            out[state].extend(out[fail[state]])
+            row = state * width
+            fail_row = fail[state] * width
+            for col in range(sigma):
+                char = alphabet_chars[col]
+                child = goto[state].get(char)
+                if child is None:
+                    delta[row + col] = delta[fail_row + col]
+                else:
+                    fail[child] = delta[fail_row + col] // width
+                    delta[row + col] = child * width
+                    order.append(child)
 
-        for char in text:
-            while node and char not in node.children:
-                node = node.fail
-            node = node.children[char] if node and char in node.children else root
-            for match in node.output:
-                match_dict[match] += 1
-                match_count += 1
+        outputs = {state * width: tuple(hits) for state, hits in enumerate(out) if hits}
+        return AhoCorasickAutomaton(keywords, alphabet, sigma, delta, outputs, overlapping)
+
+    @staticmethod
+    def compile_wu_manber(patterns: list[str], overlapping: bool = True) -> WuManberMatcher:
+        keywords = tuple(dict.fromkeys(p for p in patterns if p))
+        if not keywords:
+            return WuManberMatcher(keywords, 0, 0, {}, {}, overlapping)
+
+        shortest = min(len(pattern) for pattern in keywords)
+        block = min(2, shortest)
+        shift: dict[str, int] = {}
+        candidates: dict[str, list[int]] = {}
+        for index, pattern in enumerate(keywords):
+            for end in range(block, shortest + 1):
+                key = pattern[end - block:end]
+                distance = shortest - end
+                if distance < shift.get(key, shortest - block + 1):
+                    shift[key] = distance
+            candidates.setdefault(pattern[shortest - block:shortest], []).append(index)
+
+        frozen = {key: tuple(indices) for key, indices in candidates.items()}
+        return WuManberMatcher(keywords, shortest, block, shift, frozen, overlapping)
+
+    @staticmethod
+    def wu_manber(text: str, patterns: list[str], overlapping: bool = True) -> tuple[int, dict[str, int]]:
+        return PatternMatching.compile_wu_manber(patterns, overlapping).scan(text)
+
+    @staticmethod
+    def finditer_aho_corasick(text: str, patterns: list[str], limit: Optional[int] = None, overlapping: bool = True) -> Iterator[tuple[str, int, int]]:
+        return PatternMatching.compile_aho_corasick(patterns, overlapping).finditer(text, limit)
 
-        return match_count, dict(match_dict)
+    @staticmethod
+    def aho_corasick(text: str, patterns: list[str], overlapping: bool = True) -> tuple[int, dict[str, int]]:
+        return PatternMatching.compile_aho_corasick(patterns, overlapping).scan(text)
 
     
 # janlup tes dulu, ganti aja methodnya jadi method algoritma lu pada
@@ -233,6 +670,19 @@ if __name__ == "__main__":
         print(f"  Match: {result == expected}")
 
 
+    for name, matcher in (("Horspool", PatternMatching.horspool), ("Sunday", PatternMatching.sunday)):
+        print(f"--- {name} Function Test ---")
+
+        for i, (text, pattern, expected) in enumerate(test_cases):
+            result = matcher(text, pattern)
+            print(f"\nTest Case {i+1}:")
+            print(f"  Text: '{text}'")
+            print(f"  Pattern: '{pattern}'")
+            print(f"  Expected: {expected}")
+            print(f"  Result: {result}")
+            print(f"  Match: {result == expected}")
+
+
     print("--- Levenshtein Distance Test ---")
 
     test_cases_ld = [
@@ -269,13 +719,29 @@ if __name__ == "__main__":
         ("AAAAAA", ["AAA", "BBBB"], 4),                   # "AAA" matches 4 times in overlapping substrings
         ("ABCDEFG", [], 0),                               # No patterns, no matches
         ("", ["A", "B"], 0),                              # Empty text, no matches
-        ("ABCDEFG", [""], 8),                             # Empty pattern matches at every position (length + 1)
+        ("ABCDEFG", [""], 0),                             # Empty patterns are ignored
         ("ABCDEFG", ["CDE", "XYZ"], 1),                   # One pattern matches
         ("ABCDEFG", ["xyz", "efg"], 0),                   # Case-sensitive: no matches
     ]
 
     for i, (text, patterns, expected) in enumerate(test_cases_ac):
-        result = PatternMatching.aho_corasick(text, patterns)
+        result, _ = PatternMatching.aho_corasick(text, patterns)
+        print(f"\nTest Case {i+1}:")
+        print(f"  Text: '{text}'")
+        print(f"  Patterns: {patterns}")
+        print(f"  Expected: {expected}")
+        print(f"  Result: {result}")
+        print(f"  Match: {result == expected}")
+
+    print("--- Wu-Manber Function Test ---")
+
+    test_cases_wm = test_cases_ac + [
+        ("she sells sea shells", ["she", "sea", "he", "shells"], 6),  # "he" inside both "she"s
+        ("HELLO", ["HE", "HELLO", "LL"], 3),                           # Patterns of different lengths
+    ]
+
+    for i, (text, patterns, expected) in enumerate(test_cases_wm):
+        result, _ = PatternMatching.wu_manber(text, patterns)
         print(f"\nTest Case {i+1}:")
         print(f"  Text: '{text}'")
         print(f"  Patterns: {patterns}")
@@ -283,3 +749,55 @@ if __name__ == "__main__":
         print(f"  Result: {result}")
         print(f"  Match: {result == expected}")
 
+    print("--- Myers Distance Test ---")
+
+    for i, (text, pattern, expected) in enumerate(test_cases_ld):
+        result = PatternMatching.compile_myers(pattern).distance(text)
+        print(f"\nTest Case {i+1}:")
+        print(f"  Text: '{text}'")
+        print(f"  Pattern: '{pattern}'")
+        print(f"  Expected Levenshtein Distance: {expected}")
+        print(f"  Result: {result}")
+        print(f"  Match: {result == expected}")
+
+    print("--- Myers Closest Word Test ---")
+
+    test_cases_min_ld = [
+        ("i know python and java", "pyhton", 2, 2),  # transposition costs two edits
+        ("i know python and java", "pythn", 2, 1),   # one deletion
+        ("react developer", "reakt", 1, 1),          # one substitution
+        ("html css", "css", 2, 0),                   # exact word
+        ("sql", "kubernetes", 2, None),              # nothing within the limit
+        ("", "java", 2, None),                       # no words at all
+    ]
+
+    for i, (text, pattern, limit, expected) in enumerate(test_cases_min_ld):
+        result = PatternMatching.myers_min_ld(text, pattern, limit)
+        print(f"\nTest Case {i+1}:")
+        print(f"  Text: '{text}'")
+        print(f"  Pattern: '{pattern}'")
+        print(f"  Expected: {expected}")
+        print(f"  Result: {result}")
+        print(f"  Match: {result == expected and result == PatternMatching.min_ld(text, pattern, limit)}")
+
+    print("--- Approximate Search Test ---")
+
+    test_cases_approx = [
+        ("the quick brown fox", "quick", 2, 0, [7, 8, 9, 10, 11]),  # exact hit, plus ends within 2 edits
+        ("the quick brown fox", "quikc", 2, 1, [7, 8, 9, 10]),      # best alignment needs one edit
+        ("the quick brown fox", "qwick", 1, 1, [9]),                # one substitution
+        ("aaaa", "aa", 0, 0, [2, 3, 4]),                            # k=0 is exact, overlapping ends
+        ("abcdef", "xyz", 1, None, []),                             # no occurrence within k
+        ("", "a", 1, None, []),                                     # empty text
+        ("abc", "", 1, None, []),                                   # empty pattern
+    ]
+
+    for i, (text, pattern, k, expected_best, expected_ends) in enumerate(test_cases_approx):
+        best, ends = PatternMatching.approx_search(text, pattern, k)
+        print(f"\nTest Case {i+1}:")
+        print(f"  Text: '{text}'")
+        print(f"  Pattern: '{pattern}' (k={k})")
+        print(f"  Expected: {expected_best}, ends {expected_ends}")
+        print(f"  Result: {best}, ends {ends}")
+        print(f"  Match: {best == expected_best and ends == expected_ends}")
+
@@ -0,0 +1,102 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Optional
+from src.utils.scanner import Scanner
+from src.utils.search_scheduler import CancellationToken, SearchCancelled
+
+# Worker-side view of the corpus, attached once per process by _attach.
+_corpus: Optional[SharedMemory] = None
+_offsets: list[int] = []
+_detail_ids: list[int] = []
+
+
+def _attach(name: str, offsets: list[int], detail_ids: list[int]) -> None:
+    global _corpus, _offsets, _detail_ids
+    _corpus = SharedMemory(name=name)
+    _offsets = offsets
+    _detail_ids = detail_ids
+
+
+def _search_chunk(start: int, stop: int, algorithm: str, keywords: list[str], overlapping: bool) -> dict[int, dict[str, int]]:
+    scan = Scanner.compile(algorithm, keywords, overlapping)
+    base = _offsets[start]
+    chunk = bytes(_corpus.buf[base:_offsets[stop]])
+    documents = (
+        (_detail_ids[i], chunk[_offsets[i] - base:_offsets[i + 1] - base].decode("utf-8"))
+        for i in range(start, stop)
+    )
+    return Scanner.count(scan, documents)
+
+
+class ProcessSearchPool:
+    # The corpus is copied into one shared-memory block when the pool starts,
+    # so a query only ships (chunk bounds, algorithm, keywords) to the workers
+    # and gets back {detail_id: matches} for the CVs that matched.
+    SCAN_ALGORITHMS = Scanner.ALGORITHMS
+    # Workers are spawned rather than forked: the pool is started from a
+    # background thread of the GUI process, and a forked child would inherit
+    # its locks in whatever state they were. They reach the corpus by the
+    # shared-memory name through _attach, so nothing else is inherited.
+    START_METHOD = "spawn"
+    # Several chunks per worker, so partial results arrive while the scan runs
+    # and a slow chunk does not leave the other workers idle.
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(self, documents: list[tuple[int, str]], workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.size = len(documents)
+
+        encoded = [text.encode("utf-8") for _, text in documents]
+        offsets = [0]
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+
+        self.shared = SharedMemory(create=True, size=max(offsets[-1], 1))
+        self.shared.buf[:offsets[-1]] = b"".join(encoded)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(self.START_METHOD),
+            initializer=_attach,
+            initargs=(self.shared.name, offsets, [detail_id for detail_id, _ in documents])
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def chunks(self) -> list[tuple[int, int]]:
+        parts = self.workers * self.CHUNKS_PER_WORKER
+        step = -(-self.size // parts) if self.size else 1
+        return [(start, min(start + step, self.size)) for start in range(0, self.size, step)]
+
+    def search(self, algorithm: str, keywords: list[str], overlapping: bool = False, progress: Optional[Callable[[dict[int, dict[str, int]], int, int], None]] = None, token: Optional[CancellationToken] = None) -> dict[int, dict[str, int]]:
+        futures = [
+            self.executor.submit(_search_chunk, start, stop, algorithm, keywords, overlapping)
+            for start, stop in self.chunks()
+        ]
+        # Chunks are reported as they finish, so `progress` sees the partial
+        # counts after each one. On cancellation the chunks not yet started
+        # are dropped; running ones finish in the background.
+        counts: dict[int, dict[str, int]] = {}
+        for done, future in enumerate(as_completed(futures), 1):
+            if token is not None and token.cancelled:
+                for pending in futures:
+                    pending.cancel()
+                raise SearchCancelled()
+            counts.update(future.result())
+            if progress is not None:
+                progress(counts, done, len(futures))
+        return counts
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        if self.shared is not None:
+            self.shared.close()
+            self.shared.unlink()
+            self.shared = None
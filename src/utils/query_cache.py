@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+class QueryCache:
+    # LRU map from a query key to its ranked rows. Every entry remembers the
+    # corpus version it was computed against; a lookup under any other
+    # version is a miss and drops the stale entry.
+    def __init__(self, capacity: int = 128):
+        self.capacity = capacity
+        self.entries: OrderedDict[Hashable, tuple[Hashable, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable, version: Hashable, usable: Optional[Callable[[Any], bool]] = None) -> Optional[Any]:
+        # `usable` lets the caller turn down a current entry (say, one ranked
+        # for a smaller limit); that counts as a miss, not a hit.
+        entry = self.entries.get(key)
+        if entry is None or entry[0] != version:
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+        if usable is not None and not usable(entry[1]):
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, version: Hashable, value: Any) -> None:
+        if self.capacity <= 0:
+            return
+        self.entries[key] = (version, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self.entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
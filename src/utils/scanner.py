@@ -0,0 +1,48 @@
+from typing import Callable, Iterable
+from src.utils.pattern_matching import PatternMatching
+
+class Scanner:
+    # The one table of per-document scanners. compile() turns an algorithm and
+    # its keywords into scan(text) -> {keyword: count}, and count() runs it
+    # over (detail_id, text) pairs; Model, its streaming search and the
+    # process-pool workers all count through these two.
+    SINGLE_PATTERN = {
+        "KMP": PatternMatching.compile_kmp,
+        "Boyer-Moore": PatternMatching.compile_bm,
+        "Horspool": PatternMatching.compile_horspool,
+        "Sunday": PatternMatching.compile_sunday,
+    }
+    MULTI_PATTERN = {
+        "Aho-Corasick": PatternMatching.compile_aho_corasick,
+        "Wu-Manber": PatternMatching.compile_wu_manber,
+    }
+    ALGORITHMS = tuple(SINGLE_PATTERN) + tuple(MULTI_PATTERN)
+
+    @staticmethod
+    def compile(algorithm: str, keywords: list[str], overlapping: bool = False) -> Callable[[str], dict[str, int]]:
+        if algorithm in Scanner.MULTI_PATTERN:
+            multi_matcher = Scanner.MULTI_PATTERN[algorithm](keywords, overlapping)
+            return lambda text: multi_matcher.scan(text)[1]
+        if algorithm not in Scanner.SINGLE_PATTERN:
+            raise ValueError(f"Unsupported search algorithm '{algorithm}'.")
+
+        matchers = [Scanner.SINGLE_PATTERN[algorithm](keyword, overlapping) for keyword in keywords]
+
+        def scan(text: str) -> dict[str, int]:
+            matches = {}
+            for matcher in matchers:
+                count = matcher.count(text)
+                if count > 0:
+                    matches[matcher.pattern] = count
+            return matches
+        return scan
+
+    @staticmethod
+    def count(scan: Callable[[str], dict[str, int]], documents: Iterable[tuple[int, str]]) -> dict[int, dict[str, int]]:
+        # Only documents with at least one hit get a row.
+        counts: dict[int, dict[str, int]] = {}
+        for detail_id, text in documents:
+            matches = scan(text)
+            if matches:
+                counts[detail_id] = matches
+        return counts
@@ -0,0 +1,51 @@
+import threading
+from typing import Callable, Optional
+
+class SearchCancelled(Exception):
+    pass
+
+class CancellationToken:
+    def __init__(self):
+        self.event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.event.is_set()
+
+    def cancel(self) -> None:
+        self.event.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self.event.is_set():
+            raise SearchCancelled()
+
+class SearchScheduler:
+    # Runs one search at a time from the caller's point of view: submitting a
+    # new task cancels the token of the previous one, which stops at its next
+    # check. The old thread may still be unwinding, so results must be
+    # dropped when their token is cancelled.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.token: Optional[CancellationToken] = None
+
+    def submit(self, task: Callable[[CancellationToken], None]) -> CancellationToken:
+        with self.lock:
+            if self.token is not None:
+                self.token.cancel()
+            self.token = CancellationToken()
+            token = self.token
+        threading.Thread(target=self._run, args=(task, token), daemon=True).start()
+        return token
+
+    def cancel(self) -> None:
+        with self.lock:
+            if self.token is not None:
+                self.token.cancel()
+                self.token = None
+
+    @staticmethod
+    def _run(task: Callable[[CancellationToken], None], token: CancellationToken) -> None:
+        try:
+            task(token)
+        except SearchCancelled:
+            pass
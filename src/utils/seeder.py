@@ -89,7 +89,9 @@ def generate_random_applicant_profile(applicant_id: int) -> Optional[ApplicantPr
     
     return new_applicant
 
-def seed_database_from_csv(db: ApplicantDatabase):
+def read_entries_from_csv():
+    # Yields one (profile, detail, pdf) at a time, so a bulk import only
+    # holds the current batch of CV texts in memory.
     df = pd.read_csv("data/Resume.csv")
     id = 0
 
@@ -110,11 +112,13 @@ def seed_database_from_csv(db: ApplicantDatabase):
                 cv_text = PDFReader.read_text(cv_path),
                 cv_raw = PDFReader.read_raw(cv_path)
             )
-            db.add_applicant(new_applicant)
-            db.add_application_detail(new_application)
-            db.add_application_pdf(new_pdf)
             id += 1
-            print(f"added row {id}")
+            print(f"read row {id}")
+            yield new_applicant, new_application, new_pdf
+
+def seed_database_from_csv(db: ApplicantDatabase, batch_size: Optional[int] = None):
+    added = db.bulk_import(read_entries_from_csv(), batch_size)
+    print(f"added {added} rows")
 
 def get_all_cv() -> list[ApplicationPDF]:
     df = pd.read_csv("data/Resume.csv")
@@ -156,7 +160,7 @@ def seed_from_sql(db: ApplicantDatabase, sql_file_path: str):
         print(f"Error seeding from SQL: {e}")
         conn.rollback()
 
-def seed_pdf_from_sql_data(db: ApplicantDatabase, sql_file_path: str):
+def seed_pdf_from_sql_data(db: ApplicantDatabase, sql_file_path: str, batch_size: Optional[int] = None):
     if not os.path.exists(sql_file_path):
         print(f"SQL file not found: {sql_file_path}")
         return
@@ -181,16 +185,18 @@ def seed_pdf_from_sql_data(db: ApplicantDatabase, sql_file_path: str):
     try:
         cursor.execute("SELECT detail_id, cv_path FROM ApplicationDetail")
         rows = cursor.fetchall()
-        for detail_id, cv_path in rows:
-            if not os.path.exists(cv_path):
-                print(f"CV not found for detail_id {detail_id}: {cv_path}")
-                continue
-            pdf = ApplicationPDF(
-                detail_id=detail_id,
-                cv_text=PDFReader.read_text(cv_path),
-                cv_raw=PDFReader.read_raw(cv_path)
-            )
-            db.add_application_pdf(pdf)
+
+        def read_pdfs():
+            for detail_id, cv_path in rows:
+                if not os.path.exists(cv_path):
+                    print(f"CV not found for detail_id {detail_id}: {cv_path}")
+                    continue
+                yield ApplicationPDF(
+                    detail_id=detail_id,
+                    cv_text=PDFReader.read_text(cv_path),
+                    cv_raw=PDFReader.read_raw(cv_path)
+                )
+        db.add_application_pdfs(read_pdfs(), batch_size)
         print("Generated ApplicationPDF entries from ApplicationDetail.")
     except Exception as e:
         print(f"Error generating ApplicationPDF: {e}")
@@ -1,20 +1,47 @@
 import mysql.connector
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
+from itertools import islice
 from datetime import date
 import os
 import configparser
+from contextlib import contextmanager
+import threading
+import weakref
 
 from src.model.applicant_profile import ApplicantProfile
 from src.model.application_detail import ApplicationDetail
 from src.model.application_pdf import ApplicationPDF
 
 from src.utils.cypher import Cypher
+from src.utils.connection_pool import ConnectionPool
 
 class ApplicantDatabase:
+    INSERT_APPLICANT = '''
+            INSERT INTO ApplicantProfile 
+            (applicant_id, first_name, last_name, date_of_birth, address, phone_number)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            '''
+    INSERT_APPLICATION_DETAIL = '''
+            INSERT INTO ApplicationDetail (detail_id, applicant_id, application_role, cv_path)
+            VALUES (%s, %s, %s, %s)
+            '''
+    INSERT_APPLICATION_PDF = '''
+            INSERT INTO ApplicationPDF (detail_id, cv_text, cv_raw)
+            VALUES (%s, %s, %s)
+            '''
+
     def __init__(self, config_path: str = 'data/config.ini'):
         self.config_path = config_path
         self.db_config = self._load_db_config()
-        self.conn = None
+        self._conn = None
+        # With pool_size > 0 in [database], each thread checks out its own
+        # connection on first use and keeps it until release_connection() or
+        # until the thread object is collected.
+        self.pool: Optional[ConnectionPool] = None
+        self._local = threading.local()
+        # Bumped on every committed write so readers holding derived data
+        # (the search cache) can tell it went stale.
+        self.version = 0
         self._init_db()
 
     def __enter__(self):
@@ -44,17 +71,97 @@ class ApplicantDatabase:
             missing_keys = [k for k, v in mysql_config.items() if v is None]
             raise DatabaseError(f"Incomplete MySQL database configuration. Missing keys: {', '.join(missing_keys)}.")
         mysql_config['type'] = 'mysql'
+        try:
+            mysql_config['pool_size'] = db_section.getint('pool_size', fallback=0)
+            mysql_config['pool_timeout'] = db_section.getfloat('pool_timeout', fallback=10.0)
+            mysql_config['insert_batch_size'] = db_section.getint('insert_batch_size', fallback=500)
+        except ValueError as e:
+            raise DatabaseError(f"Invalid connection pool setting in '{self.config_path}': {e}")
         return mysql_config
 
+    def _connect(self, autocommit: bool = False):
+        return mysql.connector.connect(
+            host=self.db_config['host'],
+            user=self.db_config['user'],
+            password=self.db_config['password'],
+            database=self.db_config['database'],
+            auth_plugin='mysql_native_password',
+            autocommit=autocommit
+        )
+
+    @property
+    def conn(self):
+        dedicated = getattr(self._local, 'dedicated', None)
+        if dedicated is not None:
+            return dedicated
+        if self.pool is None:
+            return self._conn
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            try:
+                conn = self.pool.acquire()
+            except TimeoutError as e:
+                raise DatabaseError(f"Timed out waiting for a pooled connection: {e}")
+            if not conn.is_connected():
+                conn.reconnect()
+            self._local.conn = conn
+            self._local.finalizer = weakref.finalize(threading.current_thread(), self.pool.release, conn)
+        return conn
+
+    @conn.setter
+    def conn(self, value) -> None:
+        self._conn = value
+
+    def get_connection(self):
+        return self.conn
+
+    def release_connection(self) -> None:
+        # Hands the calling thread's pooled connection back right away.
+        if self.pool is not None and getattr(self._local, 'conn', None) is not None:
+            self._local.finalizer()
+            self._local.conn = None
+            self._local.finalizer = None
+
+    @contextmanager
+    def dedicated_connection(self) -> Iterator:
+        # Gives the calling thread a connection nobody else uses until the
+        # block ends, for readers that may overlap with other threads: the
+        # thread's pooled connection if there is a pool, else a fresh one
+        # that is closed on exit.
+        if self.pool is not None:
+            try:
+                yield self.conn
+            finally:
+                self.release_connection()
+            return
+        try:
+            conn = self._connect(autocommit=True)
+        except mysql.connector.Error as e:
+            raise DatabaseError(f"Error opening a dedicated connection: {e}")
+        self._local.dedicated = conn
+        try:
+            yield conn
+        finally:
+            self._local.dedicated = None
+            conn.close()
+
+    def pool_stats(self) -> Optional[dict]:
+        return self.pool.stats() if self.pool is not None else None
+
     def _init_db(self) -> None:
         try:
-            self.conn = mysql.connector.connect(
-                host=self.db_config['host'],
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                database=self.db_config['database'],
-                auth_plugin='mysql_native_password'
-            )
+            if self.db_config['pool_size'] > 0:
+                # Pooled connections autocommit, so a long-lived reader never
+                # sits on an old REPEATABLE READ snapshot and misses rows
+                # committed by other connections.
+                self.pool = ConnectionPool(
+                    lambda: self._connect(autocommit=True),
+                    self.db_config['pool_size'],
+                    self.db_config['pool_timeout'],
+                    reset=lambda conn: conn.rollback()
+                )
+            else:
+                self.conn = self._connect()
             cur = self.conn.cursor()
             cur.execute('''
             CREATE TABLE IF NOT EXISTS ApplicantProfile (
@@ -97,6 +204,10 @@ class ApplicantDatabase:
             raise DatabaseError(f"An unexpected error occurred during database initialization: {e}")
 
     def close(self) -> None:
+        if self.pool is not None:
+            self.release_connection()
+            self.pool.close()
+            return
         if self.conn and self.conn.is_connected():
             self.conn.close()
             self.conn = None
@@ -110,6 +221,7 @@ class ApplicantDatabase:
             cur.execute("DELETE FROM ApplicantProfile")
             cur.execute("SET FOREIGN_KEY_CHECKS = 1")
             self.conn.commit()
+            self.version += 1
             print("Database rows cleared successfully.")
         except mysql.connector.Error as e:
             raise DatabaseError(f"Error clearing database: {e}")
@@ -121,6 +233,7 @@ class ApplicantDatabase:
             cur.execute("DROP TABLE IF EXISTS ApplicationPDF")
             cur.execute("DROP TABLE IF EXISTS ApplicationDetail")
             cur.execute("DROP TABLE IF EXISTS ApplicantProfile")
+            self.version += 1
             print("Tables reset successfully.")
         except mysql.connector.Error as e:
             raise DatabaseError(f"Error resetting tables: {e}")
@@ -129,17 +242,9 @@ class ApplicantDatabase:
     def add_applicant(self, applicant: ApplicantProfile) -> ApplicantProfile:
         try:
             cur = self.conn.cursor()
-            cur.execute('''
-            INSERT INTO ApplicantProfile 
-            (applicant_id, first_name, last_name, date_of_birth, address, phone_number)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            ''', (applicant.applicant_id,
-                Cypher.encrypt(applicant.first_name), # Encrypt
-                Cypher.encrypt(applicant.last_name),  # Encrypt
-                applicant.date_of_birth.isoformat() if applicant.date_of_birth else None,
-                Cypher.encrypt(applicant.address),    # Encrypt
-                Cypher.encrypt(applicant.phone_number))) # Encrypt
+            cur.execute(self.INSERT_APPLICANT, self._applicant_params(applicant))
             self.conn.commit()
+            self.version += 1
             return applicant
         except mysql.connector.Error as e:
             raise DatabaseError(f"Error adding applicant: {e}")
@@ -147,13 +252,9 @@ class ApplicantDatabase:
     def add_application_detail(self, detail: ApplicationDetail) -> ApplicationDetail:
         try:
             cur = self.conn.cursor()
-            cur.execute('''
-            INSERT INTO ApplicationDetail (detail_id, applicant_id, application_role, cv_path)
-            VALUES (%s, %s, %s, %s)
-            ''', (detail.detail_id, detail.applicant_id, 
-                Cypher.encrypt(detail.application_role), # Encrypt
-                Cypher.encrypt(detail.cv_path)))         # Encrypt
+            cur.execute(self.INSERT_APPLICATION_DETAIL, self._application_detail_params(detail))
             self.conn.commit()
+            self.version += 1
             return detail
         except mysql.connector.Error as e:
             raise DatabaseError(f"Error adding application detail: {e}")
@@ -203,6 +304,7 @@ class ApplicantDatabase:
                 Cypher.encrypt(applicant.phone_number), # Encrypt
                 applicant.applicant_id))
             self.conn.commit()
+            self.version += 1
             return cur.rowcount > 0
         except mysql.connector.Error as e:
             raise DatabaseError(f"Error updating applicant: {e}")
@@ -213,6 +315,7 @@ class ApplicantDatabase:
             cur.execute('DELETE FROM ApplicationDetail WHERE applicant_id = %s', (applicant_id,))
             cur.execute('DELETE FROM ApplicantProfile WHERE applicant_id = %s', (applicant_id,))
             self.conn.commit()
+            self.version += 1
             return cur.rowcount > 0
         except mysql.connector.Error as e:
             raise DatabaseError(f"Error deleting applicant: {e}")
@@ -236,17 +339,69 @@ class ApplicantDatabase:
     def add_application_pdf(self, pdf: ApplicationPDF) -> ApplicationPDF:
         try:
             cur = self.conn.cursor()
-            cur.execute('''
-            INSERT INTO ApplicationPDF (detail_id, cv_text, cv_raw)
-            VALUES (%s, %s, %s)
-            ''', (pdf.detail_id, 
-                Cypher.encrypt(pdf.cv_text), # Encrypt
-                Cypher.encrypt(pdf.cv_raw)))  # Encrypt
+            cur.execute(self.INSERT_APPLICATION_PDF, self._application_pdf_params(pdf))
             self.conn.commit()
+            self.version += 1
             return pdf
         except mysql.connector.Error as e:
             raise DatabaseError(f"Error adding application PDF: {e}")
 
+    def _insert_batches(self, statements: list[tuple[str, list]], what: str) -> None:
+        # One transaction for the whole batch; executemany turns each INSERT
+        # into a single multi-row VALUES statement.
+        try:
+            if self.conn.autocommit:
+                self.conn.start_transaction()
+            cur = self.conn.cursor()
+            for sql, rows in statements:
+                if rows:
+                    cur.executemany(sql, rows)
+            self.conn.commit()
+            self.version += 1
+        except mysql.connector.Error as e:
+            self.conn.rollback()
+            raise DatabaseError(f"Error adding {what}: {e}")
+
+    def _batches(self, items: Iterable, batch_size: Optional[int]) -> Iterator[list]:
+        batch_size = batch_size or self.db_config['insert_batch_size']
+        iterator = iter(items)
+        while batch := list(islice(iterator, batch_size)):
+            yield batch
+
+    def add_applicants(self, applicants: Iterable[ApplicantProfile], batch_size: Optional[int] = None) -> int:
+        added = 0
+        for batch in self._batches(applicants, batch_size):
+            self._insert_batches([(self.INSERT_APPLICANT, [self._applicant_params(a) for a in batch])], "applicants")
+            added += len(batch)
+        return added
+
+    def add_application_details(self, details: Iterable[ApplicationDetail], batch_size: Optional[int] = None) -> int:
+        added = 0
+        for batch in self._batches(details, batch_size):
+            self._insert_batches([(self.INSERT_APPLICATION_DETAIL, [self._application_detail_params(d) for d in batch])], "application details")
+            added += len(batch)
+        return added
+
+    def add_application_pdfs(self, pdfs: Iterable[ApplicationPDF], batch_size: Optional[int] = None) -> int:
+        added = 0
+        for batch in self._batches(pdfs, batch_size):
+            self._insert_batches([(self.INSERT_APPLICATION_PDF, [self._application_pdf_params(p) for p in batch])], "application PDFs")
+            added += len(batch)
+        return added
+
+    def bulk_import(self, entries: Iterable[tuple[ApplicantProfile, ApplicationDetail, ApplicationPDF]], batch_size: Optional[int] = None) -> int:
+        # Profiles, details and PDFs of a batch go in together, parents first,
+        # so a failed batch leaves no orphan rows behind.
+        added = 0
+        for batch in self._batches(entries, batch_size):
+            self._insert_batches([
+                (self.INSERT_APPLICANT, [self._applicant_params(applicant) for applicant, _, _ in batch]),
+                (self.INSERT_APPLICATION_DETAIL, [self._application_detail_params(detail) for _, detail, _ in batch]),
+                (self.INSERT_APPLICATION_PDF, [self._application_pdf_params(pdf) for _, _, pdf in batch]),
+            ], "applications")
+            added += len(batch)
+        return added
+
     def get_application_pdf(self, detail_id: int) -> Optional[ApplicationPDF]:
         try:
             cur = self.conn.cursor()
@@ -267,6 +422,7 @@ class ApplicantDatabase:
                 Cypher.encrypt(pdf.cv_raw),   # Encrypt
                 pdf.detail_id))
             self.conn.commit()
+            self.version += 1
             return cur.rowcount > 0
         except mysql.connector.Error as e:
             raise DatabaseError(f"Error updating application PDF: {e}")
@@ -276,6 +432,7 @@ class ApplicantDatabase:
             cur = self.conn.cursor()
             cur.execute('DELETE FROM ApplicationPDF WHERE detail_id = %s', (detail_id,))
             self.conn.commit()
+            self.version += 1
             return cur.rowcount > 0
         except mysql.connector.Error as e:
             raise DatabaseError(f"Error deleting application PDF: {e}")
@@ -289,6 +446,112 @@ class ApplicantDatabase:
         except mysql.connector.Error as e:
             raise DatabaseError(f"Error fetching detail IDs: {e}")
 
+    def iter_applications(self, batch_size: int = 500) -> Iterator[list[tuple[ApplicantProfile, ApplicationDetail, ApplicationPDF]]]:
+        # One JOIN over the three tables read through an unbuffered (server-side)
+        # cursor, decrypted batch by batch. CVs without text are skipped, and
+        # a row that fails to decode is reported and skipped. Rows left unread
+        # when the caller stops early are drained before the cursor closes.
+        cur = None
+        try:
+            cur = self.conn.cursor(buffered=False)
+            cur.execute('''
+            SELECT p.applicant_id, p.first_name, p.last_name, p.date_of_birth, p.address, p.phone_number,
+                   d.detail_id, d.applicant_id, d.application_role, d.cv_path,
+                   f.detail_id, f.cv_text, f.cv_raw
+            FROM ApplicationDetail d
+            JOIN ApplicantProfile p ON p.applicant_id = d.applicant_id
+            JOIN ApplicationPDF f ON f.detail_id = d.detail_id
+            WHERE f.cv_text IS NOT NULL AND f.cv_text <> ''
+            ORDER BY d.detail_id
+            ''')
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                batch = []
+                for row in rows:
+                    try:
+                        batch.append((self._row_to_applicant(row[:6]),
+                                      self._row_to_application_detail(row[6:10]),
+                                      self._row_to_application_pdf(row[10:13])))
+                    except Exception:
+                        import traceback; traceback.print_exc()
+                yield batch
+        except mysql.connector.Error as e:
+            raise DatabaseError(f"Error fetching applications: {e}")
+        finally:
+            if cur is not None:
+                try:
+                    if self.conn.unread_result:
+                        self.conn.consume_results()
+                    cur.close()
+                except mysql.connector.Error:
+                    import traceback; traceback.print_exc()
+
+    def get_all_applications(self, batch_size: int = 500) -> List[tuple[ApplicantProfile, ApplicationDetail, ApplicationPDF]]:
+        applications = []
+        for batch in self.iter_applications(batch_size):
+            applications.extend(batch)
+        return applications
+
+    def iter_corpus(self, page_size: int = 500) -> Iterator[list[tuple[int, str]]]:
+        # Pages of (detail_id, cv_text) in detail_id order. Keyset pagination
+        # (detail_id > last seen) keeps each page an index range scan, and
+        # cv_raw is never read, so memory is bounded by one page.
+        # One cursor serves every page and is closed when the caller stops.
+        last_id = None
+        cur = None
+        try:
+            cur = self.conn.cursor()
+            while True:
+                try:
+                    if last_id is None:
+                        cur.execute('''
+                        SELECT detail_id, cv_text FROM ApplicationPDF
+                        WHERE cv_text IS NOT NULL AND cv_text <> ''
+                        ORDER BY detail_id LIMIT %s
+                        ''', (page_size,))
+                    else:
+                        cur.execute('''
+                        SELECT detail_id, cv_text FROM ApplicationPDF
+                        WHERE detail_id > %s AND cv_text IS NOT NULL AND cv_text <> ''
+                        ORDER BY detail_id LIMIT %s
+                        ''', (last_id, page_size))
+                    rows = cur.fetchall()
+                except mysql.connector.Error as e:
+                    raise DatabaseError(f"Error paging through CV texts: {e}")
+                if not rows:
+                    return
+                yield [(detail_id, Cypher.decrypt(cv_text).lower()) for detail_id, cv_text in rows]
+                last_id = rows[-1][0]
+        finally:
+            if cur is not None:
+                try:
+                    cur.close()
+                except mysql.connector.Error:
+                    import traceback; traceback.print_exc()
+
+
+    @staticmethod
+    def _applicant_params(applicant: ApplicantProfile) -> tuple:
+        return (applicant.applicant_id,
+            Cypher.encrypt(applicant.first_name), # Encrypt
+            Cypher.encrypt(applicant.last_name),  # Encrypt
+            applicant.date_of_birth.isoformat() if applicant.date_of_birth else None,
+            Cypher.encrypt(applicant.address),    # Encrypt
+            Cypher.encrypt(applicant.phone_number)) # Encrypt
+
+    @staticmethod
+    def _application_detail_params(detail: ApplicationDetail) -> tuple:
+        return (detail.detail_id, detail.applicant_id,
+            Cypher.encrypt(detail.application_role), # Encrypt
+            Cypher.encrypt(detail.cv_path))          # Encrypt
+
+    @staticmethod
+    def _application_pdf_params(pdf: ApplicationPDF) -> tuple:
+        return (pdf.detail_id,
+            Cypher.encrypt(pdf.cv_text), # Encrypt
+            Cypher.encrypt(pdf.cv_raw))  # Encrypt
 
     def _row_to_applicant(self, row: tuple) -> ApplicantProfile:
         dob = None
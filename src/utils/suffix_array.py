@@ -0,0 +1,80 @@
+import hashlib
+import os
+from bisect import bisect_left, bisect_right
+from typing import Optional
+import numpy as np
+from src.utils.batch_matching import BatchMatcher
+
+class SuffixArray(BatchMatcher):
+    # Same packed corpus as BatchMatcher, plus the sorted suffix start
+    # positions, so a keyword's occurrences are one contiguous SA range found
+    # by two binary searches (O(m log n)) instead of a pass over the buffer.
+    def __init__(self, texts: list[str], build: bool = True):
+        super().__init__(texts)
+        self.suffixes = self._build() if build else np.empty(0, dtype=np.int64)
+
+    def _build(self) -> np.ndarray:
+        # Prefix doubling: after the round with step k, `rank` orders suffixes
+        # by their first 2k characters. Stops once every rank is distinct.
+        n = len(self.buffer)
+        if n == 0:
+            return np.empty(0, dtype=np.int64)
+
+        rank = self.buffer.astype(np.int64)
+        step = 1
+        while True:
+            second = np.full(n, -1, dtype=np.int64)
+            second[:n - step] = rank[step:]
+            key = rank * (int(rank.max()) + 2) + (second + 1)
+            suffixes = np.argsort(key, kind="stable")
+            sorted_key = key[suffixes]
+
+            changed = np.empty(n, dtype=np.int64)
+            changed[0] = 0
+            changed[1:] = sorted_key[1:] != sorted_key[:-1]
+            rank = np.empty(n, dtype=np.int64)
+            rank[suffixes] = np.cumsum(changed)
+
+            if rank[suffixes[-1]] == n - 1:
+                return suffixes
+            step *= 2
+
+    def _prefix(self, start: int, length: int) -> bytes:
+        # Big-endian bytes compare in the same order as the code points.
+        return self.buffer[start:start + length].astype(">u4", copy=False).tobytes()
+
+    def _find(self, codes: np.ndarray) -> np.ndarray:
+        m = len(codes)
+        target = codes.astype(">u4", copy=False).tobytes()
+        key = lambda start: self._prefix(start, m)
+        low = bisect_left(self.suffixes, target, key=key)
+        high = bisect_right(self.suffixes, target, lo=low, key=key)
+        return np.sort(self.suffixes[low:high])
+
+    def fingerprint(self) -> str:
+        return hashlib.sha1(self.buffer.tobytes()).hexdigest()
+
+    def save(self, path: str) -> None:
+        np.savez(path, suffixes=self.suffixes, fingerprint=self.fingerprint())
+
+    @staticmethod
+    def load_or_build(texts: list[str], path: Optional[str] = None) -> "SuffixArray":
+        # Without a path the array is only built in memory. The file is a
+        # cache: failing to read or write it never fails the search.
+        suffix_array = SuffixArray(texts, build=False)
+        if path is not None and os.path.exists(path):
+            try:
+                with np.load(path) as cached:
+                    if str(cached["fingerprint"]) == suffix_array.fingerprint():
+                        suffix_array.suffixes = cached["suffixes"]
+                        return suffix_array
+            except Exception:
+                import traceback; traceback.print_exc()
+
+        suffix_array.suffixes = suffix_array._build()
+        if path is not None:
+            try:
+                suffix_array.save(path)
+            except Exception:
+                import traceback; traceback.print_exc()
+        return suffix_array
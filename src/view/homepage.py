@@ -1,16 +1,21 @@
 import customtkinter as ctk
+from contextlib import closing
 from tkinter import ttk
 from src.view.cv_card import CvCard
 from src.model.search_result import SearchResult
 from src.model.applicant_profile import ApplicantProfile
 from src.model.application_detail import ApplicationDetail
 from src.utils.sql import ApplicantDatabase
-from src.utils.pattern_matching import PatternMatching
-import concurrent.futures
-import os
+from src.model.model import Model
+from src.utils.query_cache import QueryCache
+from src.utils.search_scheduler import SearchScheduler, SearchCancelled
 import time
 
 class Homepage:
+    # Above this many CVs each search pages the corpus from the database
+    # instead of holding it in memory.
+    STREAMING_THRESHOLD = 20000
+
     def __init__(self, root):
         self.root = root
         ctk.set_appearance_mode("Dark")
@@ -26,8 +31,19 @@ class Homepage:
         self.keyword_var = ctk.StringVar(value="")
         self.cv_cards = []
         self.fuzzy_enabled = ctk.BooleanVar(value=True)
+        self.process_pool_enabled = ctk.BooleanVar(value=False)
+        self.live_search_enabled = ctk.BooleanVar(value=False)
+        self.live_search_job = None
+        self.last_search_duration = None
+        self.last_time_to_first_result = None
         self.match_count = ctk.IntVar(value=10)
         self.prefetched_data = []
+        self.streaming = False
+        self.corpus_size = 0
+        self.model = None
+        self.query_cache = QueryCache()
+        self.scheduler = SearchScheduler()
+        self.prefetch_count = 0
         self.prefetch()
 
         self.container = ctk.CTkFrame(self.root, fg_color="transparent")
@@ -56,11 +72,26 @@ class Homepage:
 
         self.kmp_radio = ctk.CTkRadioButton(self.radio_frame, text="KMP", variable=self.algorithm_var, value="KMP")
         self.bm_radio = ctk.CTkRadioButton(self.radio_frame, text="Boyer-Moore", variable=self.algorithm_var, value="Boyer-Moore")
-        self.aho_radio = ctk.CTkRadioButton(self.radio_frame, text="Aho-Corasick", variable=self.algorithm_var, value="Aho-Corasick")
+        self.horspool_radio = ctk.CTkRadioButton(self.radio_frame, text="Horspool", variable=self.algorithm_var, value="Horspool")
+        self.sunday_radio = ctk.CTkRadioButton(self.radio_frame, text="Sunday", variable=self.algorithm_var, value="Sunday")
 
         self.kmp_radio.pack(side="left", expand=True, fill="x", padx=5)
         self.bm_radio.pack(side="left", expand=True, fill="x", padx=5)
+        self.horspool_radio.pack(side="left", expand=True, fill="x", padx=5)
+        self.sunday_radio.pack(side="left", expand=True, fill="x", padx=5)
+
+        self.multi_radio_frame = ctk.CTkFrame(self.container, fg_color="transparent")
+        self.multi_radio_frame.pack(fill="x", pady=(0, 10), padx=(75, 0))
+
+        self.aho_radio = ctk.CTkRadioButton(self.multi_radio_frame, text="Aho-Corasick", variable=self.algorithm_var, value="Aho-Corasick")
+        self.wu_manber_radio = ctk.CTkRadioButton(self.multi_radio_frame, text="Wu-Manber", variable=self.algorithm_var, value="Wu-Manber")
+        self.batch_radio = ctk.CTkRadioButton(self.multi_radio_frame, text="NumPy Batch", variable=self.algorithm_var, value="NumPy Batch")
+        self.suffix_array_radio = ctk.CTkRadioButton(self.multi_radio_frame, text="Suffix Array", variable=self.algorithm_var, value="Suffix Array")
+
         self.aho_radio.pack(side="left", expand=True, fill="x", padx=5)
+        self.wu_manber_radio.pack(side="left", expand=True, fill="x", padx=5)
+        self.batch_radio.pack(side="left", expand=True, fill="x", padx=5)
+        self.suffix_array_radio.pack(side="left", expand=True, fill="x", padx=5)
 
         self.fuzzy_checkbox = ctk.CTkCheckBox(
             self.container,
@@ -69,6 +100,20 @@ class Homepage:
         )
         self.fuzzy_checkbox.pack(anchor='w', pady=10)
 
+        self.process_pool_checkbox = ctk.CTkCheckBox(
+            self.container,
+            text="Scan on All CPU Cores (process pool)",
+            variable=self.process_pool_enabled
+        )
+        self.process_pool_checkbox.pack(anchor='w', pady=(0, 10))
+
+        self.live_search_checkbox = ctk.CTkCheckBox(
+            self.container,
+            text="Search as You Type",
+            variable=self.live_search_enabled
+        )
+        self.live_search_checkbox.pack(anchor='w', pady=(0, 10))
+
         self.label = ctk.CTkLabel(self.container, text="Show Matches:", font=("Arial", 18))
         self.label.pack(anchor='w')
 
@@ -97,6 +142,8 @@ class Homepage:
         for i in range(3):
             self.results_frame.grid_columnconfigure(i, weight=1)
 
+        self.keyword_var.trace_add("write", self._on_keyword_changed)
+
     def validate_entry_matches(self, value):
         if value == "":
             return True 
@@ -104,118 +151,98 @@ class Homepage:
     
     def prefetch(self):
         self.prefetched_data = []
-        detail_ids = self.db.get_all_detail_ids()
-
-        for detail_id in detail_ids:
-            try:
-                result = self.db.get_application_with_details(detail_id)
-                if not result:
-                    continue
-
-                applicant, application_detail = result
-                application_pdf = self.db.get_application_pdf(application_detail.detail_id)
-
-                if not application_pdf or not application_pdf.cv_text:
-                    continue
-
-                self.prefetched_data.append((applicant, application_detail, application_pdf))
-
-            except Exception:
-                import traceback; traceback.print_exc()
+        self.streaming = False
+        try:
+            self.corpus_size = self.db.get_application_count()
+            self.streaming = self.corpus_size > self.STREAMING_THRESHOLD
+            if not self.streaming:
+                self.prefetched_data = self.db.get_all_applications()
+                self.corpus_size = len(self.prefetched_data)
+        except Exception:
+            import traceback; traceback.print_exc()
+
+        if self.model is not None:
+            self.model.close()
+        self.prefetch_count += 1
+        prefetch_count = self.prefetch_count
+        self.model = Model(
+            self.prefetched_data,
+            cache=self.query_cache,
+            corpus_version=lambda: (prefetch_count, self.db.version),
+            suffix_array_path=Model.SUFFIX_ARRAY_PATH
+        )
 
-    def _on_search(self):
+    def _on_keyword_changed(self, *args):
+        if not self.live_search_enabled.get():
+            return
+        # Wait for a pause in typing, then reuse the per-keyword counts of the
+        # previous query so only new keywords are scanned.
+        if self.live_search_job is not None:
+            self.root.after_cancel(self.live_search_job)
+        self.live_search_job = self.root.after(300, lambda: self._on_search(incremental=True))
+
+    def _on_search(self, incremental=False):
+        self.live_search_job = None
         try:
+            # The button stays clickable: a new search supersedes the running one.
             self.search_button.configure(
                 text="Searching...",
-                fg_color="#555555",
-                state="disabled"
+                fg_color="#555555"
             )
             self.clear_cv_cards()
-            keywords = list(dict.fromkeys([kw.strip() for kw in self.keyword_var.get().lower().split(',') if kw.strip()]))
+            keywords = Model.parse_keywords(self.keyword_var.get())
             match_limit = self.match_count.get()
-            max_workers = min(32, os.cpu_count() * 5)
-
-            def process_entry(entry):
+            algorithm = self.algorithm_var.get()
+            fuzzy_enabled = self.fuzzy_enabled.get()
+            use_process_pool = self.process_pool_enabled.get()
+            model = self.model
+            streaming = self.streaming
+            corpus_size = self.corpus_size
+
+            # Filled in by the worker; first_result is the time-to-first-result
+            # metric, measured apart from the total scan time.
+            timing = {"start": time.time(), "first_result": None}
+
+            # The callbacks get the token the scheduler handed to this search,
+            # so a superseded search can tell its results are stale.
+            def show_progress(token, results, done, total):
+                if token.cancelled:
+                    return
                 try:
-                    applicant, application_details, application_pdf = entry
-                    cv_text = application_pdf.cv_text
-                    matches = {}
-                    algorithm = self.algorithm_var.get()
-
-                    if algorithm == "Aho-Corasick":
-                        match_score, matches = PatternMatching.aho_corasick(cv_text, keywords)
-                    else:
-                        for keyword in keywords:
-                            count = 0
-                            if algorithm == "KMP":
-                                count = PatternMatching.kmp(cv_text, keyword)
-                            elif algorithm == "Boyer-Moore":
-                                count = PatternMatching.bm(cv_text, keyword)
-                            if count > 0:
-                                matches[keyword] = count
-
-                    match_score = sum(matches.values())
-                    has_all_keywords = all(keyword in matches for keyword in keywords)
-
-                    result = None
-                    if has_all_keywords:
-                        result = (10000000 + match_score, SearchResult(applicant, application_details, application_pdf, matches))
-                    elif matches:
-                        result = (match_score, SearchResult(applicant, application_details, application_pdf, matches))
-
-                    fuzzy_result = None
-
-                    if self.fuzzy_enabled.get():
-                        fuzzy_score = 0
-                        fuzzy_valid = True
-                        fuzzy_distances = {}
-
-                        for keyword in keywords:
-                            if keyword in matches:
-                                continue
-                            dist = PatternMatching.min_ld(cv_text, keyword, 2)
-                            if dist is None or dist > 10:
-                                fuzzy_valid = False
-                                break
-                            fuzzy_distances[keyword] = dist
-                            fuzzy_score += dist
-
-                        if fuzzy_valid:
-                            fuzzy_result = (fuzzy_score, SearchResult(applicant, application_details, application_pdf, fuzzy_distances))
-
-                    return result, fuzzy_result
-
+                    self.clear_cv_cards()
+                    for res in results:
+                        self.add_cv_card(res)
+                    self.status_label.configure(text=f"Scanning... {done}/{total} done, {len(results)} provisional matches.")
                 except Exception:
                     import traceback; traceback.print_exc()
-                    return None, None
-
 
-            def on_complete(results_with_scores, duration):
+            def on_progress(token, results, done, total):
+                # Runs on the worker thread; Model already throttles these to
+                # one provisional top k per PROGRESS_INTERVAL.
+                if token.cancelled or not results:
+                    return
+                if timing["first_result"] is None:
+                    timing["first_result"] = time.time() - timing["start"]
+                self.root.after(0, lambda: show_progress(token, results, done, total))
+
+            def on_complete(token, results, duration):
+                # A superseded search may still finish; its results are stale.
+                if token.cancelled:
+                    return
                 try:
-                    exact_matches = []
-                    fuzzy_candidates = []
-
-                    for exact, fuzzy in results_with_scores:
-                        if exact:
-                            exact_matches.append(exact)
-                        elif fuzzy:
-                            fuzzy_candidates.append(fuzzy)
-
-                    exact_matches.sort(key=lambda x: x[0], reverse=True)
-                    fuzzy_candidates.sort(key=lambda x: x[0])
-
-                    final_results = exact_matches[:match_limit]
-                    remaining = match_limit - len(final_results)
-                    if remaining > 0:
-                        final_results += fuzzy_candidates[:remaining]
-
-                    self.search_results = [res for _, res in final_results]
+                    self.clear_cv_cards()
+                    self.search_results = results
                     for res in self.search_results:
                         self.add_cv_card(res)
 
                     ms = duration * 1000
+                    first_ms = (timing["first_result"] if timing["first_result"] is not None else duration) * 1000
+                    self.last_search_duration = duration
+                    self.last_time_to_first_result = first_ms / 1000
+                    cache = self.query_cache
                     self.status_label.configure(
-                        text=f"Scanned {len(self.prefetched_data)} CVs in {ms:.0f} ms."
+                        text=f"Scanned {corpus_size} CVs in {ms:.0f} ms (first result after {first_ms:.0f} ms). "
+                             f"Cache: {cache.hits} hits, {cache.misses} misses."
                     )
                     self.search_button.configure(
                         text="Search",
@@ -225,40 +252,42 @@ class Homepage:
                 except Exception:
                     import traceback; traceback.print_exc()
 
-            def run_in_background():
-                start_time = time.time()
+            def run_in_background(token):
                 results = []
-                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    futures = [executor.submit(process_entry, entry) for entry in self.prefetched_data]
-                    for f in concurrent.futures.as_completed(futures):
-                        res = f.result()
-                        if res:
-                            results.append(res)
-                duration = time.time() - start_time
-                self.root.after(0, lambda: on_complete(results, duration))
-
-            import threading
-            threading.Thread(target=run_in_background, daemon=True).start()
+                try:
+                    if streaming:
+                        # A superseded search may still be paging, so each one
+                        # reads through a connection of its own.
+                        with self.db.dedicated_connection(), closing(self.db.iter_corpus()) as pages:
+                            ranked = Model.search_stream(pages, keywords, algorithm, fuzzy_enabled, match_limit, token)
+                            results = self.load_results(ranked, token)
+                    else:
+                        results = model.search(keywords, algorithm, fuzzy_enabled, match_limit, use_process_pool, incremental,
+                            lambda partial, done, total: on_progress(token, partial, done, total), token)
+                except SearchCancelled:
+                    return
+                except Exception:
+                    import traceback; traceback.print_exc()
+                duration = time.time() - timing["start"]
+                self.root.after(0, lambda: on_complete(token, results, duration))
+
+            self.scheduler.submit(run_in_background)
 
         except Exception as e:
             print(f"Error during search: {e}")
 
-
-    def fuzzy_search(text: str, pattern: str, max_distance=5) -> int | None:
-        t_len = len(text)
-        p_len = len(pattern)
-        window = p_len + max_distance
-        best_distance = max_distance + 1
-
-        for i in range(t_len - p_len + 1):
-            window_text = text[i:i + p_len]
-            dist = PatternMatching.ld(window_text, pattern)
-            if dist < best_distance:
-                best_distance = dist
-            if best_distance == 0:
-                break
-
-        return best_distance if best_distance <= max_distance else None
+    def load_results(self, ranked, token=None):
+        # Streaming searches only keep ids; the top k are loaded afterwards.
+        results = []
+        for _, detail_id, matches in ranked:
+            if token is not None:
+                token.raise_if_cancelled()
+            found = self.db.get_application_with_details(detail_id)
+            application_pdf = self.db.get_application_pdf(detail_id)
+            if found and application_pdf:
+                applicant, application_detail = found
+                results.append(SearchResult(applicant, application_detail, application_pdf, matches))
+        return results
 
     def clear_cv_cards(self):
         for card in self.cv_cards:
@@ -276,7 +305,12 @@ class Homepage:
         self.cv_cards.append(card)
 
     def run(self):
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.scheduler.cancel()
+            if self.model is not None:
+                self.model.close()
 
 if __name__ == "__main__":
     root = ctk.CTk()